@@ -9,7 +9,7 @@ import re
 import traceback
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Dict, ItemsView, Tuple, ValuesView
+from typing import Any, Dict, ItemsView, List, Optional, Set, Tuple, ValuesView
 
 import requests
 from bpy.app.translations import pgettext as _
@@ -186,14 +186,51 @@ class _Utilities:
             raise
 
 
+def _to_trigrams(text: str) -> Set[str]:
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
 class AssetRegistry:
     def __init__(self, *assets: AssetDescription):
         self.assets: Dict[str, AssetDescription] = {}
+        self._keyword_trigram_index: Optional[Dict[str, Set[str]]] = None
+        self._asset_ordinals: Dict[str, int] = {}
         for asset in assets:
             self.add(asset)
 
     def add(self, asset: AssetDescription):
         self.assets[asset.id] = asset
+        self._keyword_trigram_index = None
+
+    def _get_keyword_trigram_index(self) -> Dict[str, Set[str]]:
+        if self._keyword_trigram_index is None:
+            index: Dict[str, Set[str]] = {}
+            for asset in self.assets.values():
+                for trigram in _to_trigrams(asset.keywords):
+                    index.setdefault(trigram, set()).add(asset.id)
+            self._keyword_trigram_index = index
+            self._asset_ordinals = {asset_id: ordinal for ordinal, asset_id in enumerate(self.assets)}
+
+        return self._keyword_trigram_index
+
+    def search_keywords(self, text: str) -> List[AssetDescription]:
+        """Returns the assets whose keywords contain the lowercased text, in registration order."""
+        trigrams = _to_trigrams(text)
+        if not trigrams:
+            return [asset for asset in self.assets.values() if text in asset.keywords]
+
+        index = self._get_keyword_trigram_index()
+        candidate_ids: Optional[Set[str]] = None
+        for trigram in sorted(trigrams, key=lambda t: len(index.get(t, ()))):
+            asset_ids = index.get(trigram)
+            if not asset_ids:
+                return []
+
+            candidate_ids = set(asset_ids) if candidate_ids is None else candidate_ids & asset_ids
+            if not candidate_ids:
+                return []
+
+        return [self.assets[asset_id] for asset_id in sorted(candidate_ids, key=self._asset_ordinals.__getitem__) if text in self.assets[asset_id].keywords]
 
     def __contains__(self, identifier: str) -> bool:
         return identifier in self.assets
@@ -211,6 +248,7 @@ class AssetRegistry:
         preferences = get_preferences()
 
         self.assets.clear()
+        self._keyword_trigram_index = None
 
         json_paths = glob.glob(os.path.join(preferences.asset_jsons_folder, "*.json"))
         json_paths.sort()
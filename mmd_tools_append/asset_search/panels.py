@@ -18,6 +18,7 @@ from .actions import ImportActionExecutor, MessageException
 from .assets import ASSETS, AssetDescription, AssetType
 from .cache import CONTENT_CACHE, Content, Task
 from .operators import DeleteDebugAssetJson, ReloadAssetJsons, UpdateAssetJson, UpdateDebugAssetJson
+from .properties import mark_search_dispatched
 
 PREVIEWS: Optional[bpy.utils.previews.ImagePreviewCollection]
 
@@ -83,7 +84,8 @@ class AssetSearch(bpy.types.Operator):
                 content.filepath = os.path.join(PACKAGE_PATH, "thumbnails", "ASSET_THUMBNAIL_EMPTY.png")
             PREVIEWS.load(asset.thumbnail_url, content.filepath, "IMAGE")
 
-        region.tag_redraw()
+        if region is not None:
+            region.tag_redraw()
 
     def execute(self, context):
         # pylint: disable=too-many-locals
@@ -98,14 +100,13 @@ class AssetSearch(bpy.types.Operator):
         query_tags = query.tags
         query_is_cached = query.is_cached
 
-        enabled_tag_names = {tag.name for tag in query_tags if tag.enabled}
-        enabled_tag_count = len(enabled_tag_names)
+        enabled_tag_names = frozenset(tag.name for tag in query_tags if tag.enabled)
 
         search_results: List[AssetDescription] = []
         search_results = [
             asset
-            for asset in ASSETS.values()
-            if (query_type in {AssetType.ALL.name, asset.type.name} and enabled_tag_count == len(asset.tag_names & enabled_tag_names) and query_text in asset.keywords and (Utilities.is_importable(asset) if query_is_cached else True))
+            for asset in ASSETS.search_keywords(query_text)
+            if (query_type in {AssetType.ALL.name, asset.type.name} and enabled_tag_names.issubset(asset.tag_names) and (Utilities.is_importable(asset) if query_is_cached else True))
         ]
 
         hit_count = len(search_results)
@@ -123,16 +124,14 @@ class AssetSearch(bpy.types.Operator):
         for asset in search_results:
             tag_names.update(asset.tag_names)
 
-        query.is_updating = True
-        try:
-            query_tags.clear()
-            query.tags_index = 0
-            for tag_name in sorted(tag_names):
-                tag = query_tags.add()
-                tag.name = tag_name
-                tag.enabled = tag_name in enabled_tag_names
-        finally:
-            query.is_updating = False
+        query_tags.clear()
+        query.tags_index = 0
+        for tag_name in sorted(tag_names):
+            tag = query_tags.add()
+            tag.name = tag_name
+            tag.enabled = tag_name in enabled_tag_names
+
+        mark_search_dispatched(query)
 
         return {"FINISHED"}
 
@@ -1,16 +1,94 @@
 # Copyright 2021 UuuNyaa <UuuNyaa@gmail.com>
 # This file is part of MMD Tools Append.
 
+import functools
+from typing import Callable, Optional
+
 import bpy
 
+from .. import UNREGISTER_HOOKS
 from .assets import AssetType, AssetUpdater
 
+SEARCH_DEBOUNCE_INTERVAL = 0.2
 
-def update_search_query(_, context):
-    if context.scene.mmd_tools_append_asset_search.query.is_updating:
-        return
 
-    bpy.ops.mmd_tools_append.asset_search()  # pylint: disable=no-member
+# the registered debounce timer function, if any
+_pending_search: Optional[Callable[[], None]] = None
+
+
+def _as_pointer(struct) -> int:
+    return 0 if struct is None else struct.as_pointer()
+
+
+def _find_window_area_region(window_pointer: int, area_pointer: int, region_pointer: int) -> dict:
+    """Returns the temp_override arguments of the window, area and region that still exist, matched by pointer."""
+    for window in bpy.context.window_manager.windows:
+        if window.as_pointer() != window_pointer:
+            continue
+
+        for area in window.screen.areas:
+            if area.as_pointer() != area_pointer:
+                continue
+
+            for region in area.regions:
+                if region.as_pointer() == region_pointer:
+                    return {"window": window, "area": area, "region": region}
+
+            return {"window": window, "area": area}
+
+        return {"window": window}
+
+    return {}
+
+
+def _execute_pending_search(window_pointer: int, area_pointer: int, region_pointer: int, scene_session_uid: int):
+    global _pending_search  # pylint: disable=global-statement
+    _pending_search = None
+
+    scene = next((s for s in bpy.data.scenes if s.session_uid == scene_session_uid), None)
+    if scene is None:
+        return None
+
+    query = scene.mmd_tools_append_asset_search.query
+    if query.update_token == query.dispatched_token:
+        return None
+
+    # search in the region the query was edited from, or without one if it is gone (e.g. the query was changed by a script)
+    with bpy.context.temp_override(**_find_window_area_region(window_pointer, area_pointer, region_pointer), scene=scene):
+        bpy.ops.mmd_tools_append.asset_search()  # pylint: disable=no-member
+
+    return None
+
+
+def cancel_pending_search():
+    global _pending_search  # pylint: disable=global-statement
+    if _pending_search is not None and bpy.app.timers.is_registered(_pending_search):
+        bpy.app.timers.unregister(_pending_search)
+    _pending_search = None
+
+
+def mark_search_dispatched(query):
+    """Mark the current query state as searched, so pending updates caused by the search itself are dropped."""
+    query.dispatched_token = query.update_token
+
+
+def update_search_query(_, context):
+    global _pending_search  # pylint: disable=global-statement
+    scene = context.scene
+    scene.mmd_tools_append_asset_search.query.update_token += 1
+
+    # coalesce rapid changes (e.g. typing) into a single search
+    cancel_pending_search()
+
+    # UI data may be freed before the timer fires, so keep pointers and look them up again then
+    _pending_search = functools.partial(
+        _execute_pending_search,
+        _as_pointer(context.window),
+        _as_pointer(context.area),
+        _as_pointer(context.region),
+        scene.session_uid,
+    )
+    bpy.app.timers.register(_pending_search, first_interval=SEARCH_DEBOUNCE_INTERVAL)
 
 
 class TagItem(bpy.types.PropertyGroup):
@@ -20,7 +98,6 @@ class TagItem(bpy.types.PropertyGroup):
 
 class AssetItem(bpy.types.PropertyGroup):
     id: bpy.props.StringProperty()
-    thumbnail_filepath: bpy.props.StringProperty()
 
 
 class AssetSearchResult(bpy.types.PropertyGroup):
@@ -41,7 +118,9 @@ class AssetSearchQuery(bpy.types.PropertyGroup):
     is_cached: bpy.props.BoolProperty(update=update_search_query, options={"SKIP_SAVE"})
     tags: bpy.props.CollectionProperty(type=TagItem, options={"SKIP_SAVE"})
     tags_index: bpy.props.IntProperty(options={"SKIP_SAVE"})
-    is_updating: bpy.props.BoolProperty(options={"SKIP_SAVE"})
+    update_token: bpy.props.IntProperty(options={"SKIP_SAVE", "HIDDEN"})
+    # update_token of the query the last search ran for
+    dispatched_token: bpy.props.IntProperty(options={"SKIP_SAVE", "HIDDEN"})
 
 
 class AssetSearchProperties(bpy.types.PropertyGroup):
@@ -72,3 +151,6 @@ class AssetOperatorProperties(bpy.types.PropertyGroup):
     @staticmethod
     def unregister():
         del bpy.types.Scene.mmd_tools_append_asset_operator
+
+
+UNREGISTER_HOOKS.append(cancel_pending_search)
@@ -1,14 +1,16 @@
 # Copyright 2021 UuuNyaa <UuuNyaa@gmail.com>
 # This file is part of MMD Tools Append.
 
-from typing import Iterable, Iterator, List
+import itertools
+import math
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 import bpy
 from bpy.app.translations import pgettext as _
 
 from ...editors.meshes import MeshEditor
 from ...tuners import TunerABC, TunerRegistry
-from ...utilities import MMD_TOOLS_IMPORT_HOOKS, MessageException, import_mmd_tools
+from ...utilities import MMD_TOOLS_IMPORT_HOOKS, MessageException, get_data_cache_epoch, import_mmd_tools, invalidate_data_caches
 from .rigid_body_to_cloth import (
     PhysicsMode,
     RigidBodyToClothConverter,
@@ -26,7 +28,9 @@ def on_import_mmd_tools_ensure_cloth_methods(mmd_tools):
     2. Adds Model.clothGroupObject(self):
         - Lazily resolves (and caches on the instance as _cloth_grp) a dedicated
           container object named "cloths" parented to the model's root object.
-        - Searches existing children of rootObject() for an object named "cloths".
+        - Looks up an object named "cloths" in bpy.data.objects and accepts it
+          only if it is parented to rootObject().
+        - Re-resolves the cached object if it was removed or re-parented.
         - If absent, creates a new empty object via mmd_tools.bpyutils.FnContext.new_and_link_object.
         - Configures the new object to be:
              * Hidden and unselectable (hide, hide_select = True)
@@ -35,7 +39,7 @@ def on_import_mmd_tools_ensure_cloth_methods(mmd_tools):
     3. Adds Model.cloths(self):
         - Iterates over all objects returned by Model.allObjects(clothGroupObject()).
         - Yields only MESH type objects that have an existing cloth modifier, as
-          determined by MeshEditor(obj).find_cloth_modifier().
+          determined by _is_cloth_mesh(obj).
 
     Side Effects:
     - Mutates the mmd_tools.core.model.Model class by attaching two methods:
@@ -59,15 +63,16 @@ def on_import_mmd_tools_ensure_cloth_methods(mmd_tools):
          components would surface as AttributeError at runtime).
 
     Usage Pattern:
-         ensure_cloth_methods()
+         mmd_tools = import_mmd_tools()  # runs this hook on the first call
          model = mmd_tools.core.model.Model(...)
          grp = model.clothGroupObject()
          for cloth_obj in model.cloths():
               ...
 
     Rationale:
-    - Centralizes the patch so add-on code can safely call ensure_cloth_methods()
-      before relying on the extended API, without risking duplicate definitions.
+    - Registered in MMD_TOOLS_IMPORT_HOOKS instead of being applied at module
+      import, so mmd_tools is neither imported nor patched until the add-on
+      actually needs it, and the patch is applied exactly once.
     """
 
     if hasattr(mmd_tools.core.model.Model, "clothGroupObject"):
@@ -75,35 +80,35 @@ def on_import_mmd_tools_ensure_cloth_methods(mmd_tools):
 
     def mmd_model_cloth_group_object_method(self):
         # pylint: disable=protected-access
-        if not hasattr(self, "_cloth_grp"):
-            self._cloth_grp = None
-            for i in self.rootObject().children:
-                if i.name == "cloths":
-                    self._cloth_grp = i
-                    break
-
-            if self._cloth_grp is None:
-                cloths = mmd_tools.bpyutils.FnContext.new_and_link_object(bpy.context, name="cloths", object_data=None)
-                cloths.parent = self.rootObject()
-                cloths.hide = cloths.hide_select = True
-                cloths.lock_rotation = cloths.lock_location = cloths.lock_scale = [
-                    True,
-                    True,
-                    True,
-                ]
-                self._cloth_grp = cloths
-
+        root_object = self.rootObject()
+
+        cloth_grp = getattr(self, "_cloth_grp", None)
+        if cloth_grp is not None:
+            try:
+                if cloth_grp.parent == root_object:
+                    return cloth_grp
+            except ReferenceError:
+                # the cached object has been removed
+                pass
+
+        cloth_grp = bpy.data.objects.get("cloths")
+        if cloth_grp is None or cloth_grp.parent != root_object:
+            cloth_grp = mmd_tools.bpyutils.FnContext.new_and_link_object(bpy.context, name="cloths", object_data=None)
+            cloth_grp.parent = root_object
+            cloth_grp.hide = cloth_grp.hide_select = True
+            cloth_grp.lock_rotation = cloth_grp.lock_location = cloth_grp.lock_scale = [
+                True,
+                True,
+                True,
+            ]
+
+        self._cloth_grp = cloth_grp
         return self._cloth_grp
 
     mmd_tools.core.model.Model.clothGroupObject = mmd_model_cloth_group_object_method
 
     def mmd_model_cloths_method(self):
-        for obj in self.allObjects(self.clothGroupObject()):
-            if obj.type != "MESH":
-                continue
-            if MeshEditor(obj).find_cloth_modifier() is None:
-                continue
-            yield obj
+        return filter(_is_cloth_mesh, self.allObjects(self.clothGroupObject()))
 
     mmd_tools.core.model.Model.cloths = mmd_model_cloths_method
 
@@ -111,8 +116,130 @@ def on_import_mmd_tools_ensure_cloth_methods(mmd_tools):
 MMD_TOOLS_IMPORT_HOOKS.append(on_import_mmd_tools_ensure_cloth_methods)
 
 
+# (data cache epoch, object session uid -> cloth modifier name), validated on every lookup and dropped once the epoch moves
+_CLOTH_MODIFIER_NAMES: Tuple[int, Dict[int, str]] = (-1, {})
+
+
+def _find_cloth_modifier(obj: bpy.types.Object) -> Optional[bpy.types.ClothModifier]:
+    global _CLOTH_MODIFIER_NAMES  # pylint: disable=global-statement
+
+    epoch, cloth_modifier_names = _CLOTH_MODIFIER_NAMES
+    if epoch != get_data_cache_epoch():
+        cloth_modifier_names = {}
+        _CLOTH_MODIFIER_NAMES = (get_data_cache_epoch(), cloth_modifier_names)
+
+    modifier_name = cloth_modifier_names.get(obj.session_uid)
+    if modifier_name is not None:
+        modifier = obj.modifiers.get(modifier_name)
+        if modifier is not None and modifier.type == "CLOTH":
+            return modifier
+
+    modifier = MeshEditor(obj).find_cloth_modifier()
+    if modifier is not None:
+        cloth_modifier_names[obj.session_uid] = modifier.name
+
+    return modifier
+
+
+def _find_cloth_subsurface_modifier(obj: bpy.types.Object) -> Optional[bpy.types.SubsurfModifier]:
+    modifier = obj.modifiers.get("physics_cloth_subsurface")
+    if modifier is None or modifier.type != "SUBSURF":
+        return None
+    return modifier
+
+
+def _is_cloth_mesh(obj: bpy.types.Object) -> bool:
+    return obj.type == "MESH" and _find_cloth_modifier(obj) is not None
+
+
+def _resolve_cloth(obj: bpy.types.Object) -> Tuple[Optional[bpy.types.ClothSettings], Optional[bpy.types.ClothCollisionSettings], Optional[bpy.types.PointCache]]:
+    modifier = _find_cloth_modifier(obj)
+    if modifier is None:
+        return (None, None, None)
+
+    return (modifier.settings, modifier.collision_settings, modifier.point_cache)
+
+
+# (data cache epoch, target object name -> [(object name, modifier name)]), rebuilt lazily once the epoch moves
+_SURFACE_DEFORM_TARGETS: Tuple[int, Dict[str, List[Tuple[str, str]]]] = (-1, {})
+
+
+def _find_surface_deform_modifiers(target_object: bpy.types.Object) -> List[bpy.types.SurfaceDeformModifier]:
+    global _SURFACE_DEFORM_TARGETS  # pylint: disable=global-statement
+
+    epoch, surface_deform_targets = _SURFACE_DEFORM_TARGETS
+    if epoch != get_data_cache_epoch():
+        surface_deform_targets = {}
+        for obj in bpy.data.objects:
+            for modifier in obj.modifiers:
+                if modifier.type == "SURFACE_DEFORM" and modifier.target is not None:
+                    surface_deform_targets.setdefault(modifier.target.name, []).append((obj.name, modifier.name))
+        _SURFACE_DEFORM_TARGETS = (get_data_cache_epoch(), surface_deform_targets)
+
+    modifiers: List[bpy.types.SurfaceDeformModifier] = []
+    for object_name, modifier_name in surface_deform_targets.get(target_object.name, ()):
+        obj = bpy.data.objects.get(object_name)
+        if obj is None:
+            continue
+
+        modifier = obj.modifiers.get(modifier_name)
+        if modifier is None or modifier.type != "SURFACE_DEFORM" or modifier.target != target_object:
+            continue
+
+        modifiers.append(modifier)
+
+    return modifiers
+
+
+# (data cache epoch, names of mesh objects with a cloth modifier), rebuilt lazily once the epoch moves
+_CLOTH_MESH_NAMES: Tuple[int, Set[str]] = (-1, set())
+
+
+def _iterate_cloth_mesh_objects() -> Iterator[bpy.types.Object]:
+    global _CLOTH_MESH_NAMES  # pylint: disable=global-statement
+
+    epoch, cloth_mesh_names = _CLOTH_MESH_NAMES
+    if epoch != get_data_cache_epoch():
+        cloth_mesh_names = {o.name for o in filter(_is_cloth_mesh, bpy.data.objects)}
+        _CLOTH_MESH_NAMES = (get_data_cache_epoch(), cloth_mesh_names)
+
+    for object_name in cloth_mesh_names:
+        obj = bpy.data.objects.get(object_name)
+        if obj is None or not _is_cloth_mesh(obj):
+            continue
+
+        yield obj
+
+
+class _BatchedClothUpdates:
+    """Reentrant scope in which cloth settings writes that would not change the value are skipped."""
+
+    depth = 0
+
+    def __enter__(self):
+        _BatchedClothUpdates.depth += 1
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        _BatchedClothUpdates.depth -= 1
+
+
+def _assign_cloth_setting(settings, name: str, value):
+    # every RNA write tags the cloth modifier for re-evaluation, even if the value is unchanged;
+    # float settings are stored as float32, so compare with a tolerance
+    if _BatchedClothUpdates.depth > 0 and math.isclose(getattr(settings, name), value, rel_tol=1e-6):
+        return
+
+    setattr(settings, name, value)
+
+
 class ClothTunerABC(TunerABC, MeshEditor):
-    pass
+    PARAMS: Dict[str, float] = {}
+
+    def execute(self):
+        cloth_settings: bpy.types.ClothSettings = self.find_cloth_settings()
+        for name, value in self.PARAMS.items():
+            _assign_cloth_setting(cloth_settings, name, value)
 
 
 class NothingClothTuner(ClothTunerABC):
@@ -129,6 +256,19 @@ class NothingClothTuner(ClothTunerABC):
 
 
 class CottonClothTuner(ClothTunerABC):
+    PARAMS = {
+        "mass": 0.300,
+        "air_damping": 1.000,
+        "tension_stiffness": 15,
+        "compression_stiffness": 15,
+        "shear_stiffness": 15,
+        "bending_stiffness": 0.500,
+        "tension_damping": 5,
+        "compression_damping": 5,
+        "shear_damping": 5,
+        "bending_damping": 0.5,
+    }
+
     @classmethod
     def get_id(cls) -> str:
         return "PHYSICS_CLOTH_COTTON"
@@ -137,21 +277,21 @@ class CottonClothTuner(ClothTunerABC):
     def get_name(cls) -> str:
         return "Cotton"
 
-    def execute(self):
-        cloth_settings: bpy.types.ClothSettings = self.find_cloth_settings()
-        cloth_settings.mass = 0.300
-        cloth_settings.air_damping = 1.000
-        cloth_settings.tension_stiffness = 15
-        cloth_settings.compression_stiffness = 15
-        cloth_settings.shear_stiffness = 15
-        cloth_settings.bending_stiffness = 0.500
-        cloth_settings.tension_damping = 5
-        cloth_settings.compression_damping = 5
-        cloth_settings.shear_damping = 5
-        cloth_settings.bending_damping = 0.5
-
 
 class SilkClothTuner(ClothTunerABC):
+    PARAMS = {
+        "mass": 0.150,
+        "air_damping": 1.000,
+        "tension_stiffness": 5,
+        "compression_stiffness": 5,
+        "shear_stiffness": 5,
+        "bending_stiffness": 0.05,
+        "tension_damping": 0,
+        "compression_damping": 0,
+        "shear_damping": 0,
+        "bending_damping": 0.5,
+    }
+
     @classmethod
     def get_id(cls) -> str:
         return "PHYSICS_CLOTH_SILK"
@@ -160,21 +300,21 @@ class SilkClothTuner(ClothTunerABC):
     def get_name(cls) -> str:
         return "Silk"
 
-    def execute(self):
-        cloth_settings: bpy.types.ClothSettings = self.find_cloth_settings()
-        cloth_settings.mass = 0.150
-        cloth_settings.air_damping = 1.000
-        cloth_settings.tension_stiffness = 5
-        cloth_settings.compression_stiffness = 5
-        cloth_settings.shear_stiffness = 5
-        cloth_settings.bending_stiffness = 0.05
-        cloth_settings.tension_damping = 0
-        cloth_settings.compression_damping = 0
-        cloth_settings.shear_damping = 0
-        cloth_settings.bending_damping = 0.5
-
 
 class BreastPyramidClothTuner(ClothTunerABC):
+    PARAMS = {
+        "mass": 1.000,
+        "air_damping": 1.000,
+        "tension_stiffness": 5,
+        "compression_stiffness": 5,
+        "shear_stiffness": 5,
+        "bending_stiffness": 0.05,
+        "tension_damping": 0,
+        "compression_damping": 0,
+        "shear_damping": 0,
+        "bending_damping": 0.5,
+    }
+
     @classmethod
     def get_id(cls) -> str:
         return "PHYSICS_CLOTH_BREAST_PYRAMID"
@@ -183,19 +323,6 @@ class BreastPyramidClothTuner(ClothTunerABC):
     def get_name(cls) -> str:
         return "Breast Pyramid"
 
-    def execute(self):
-        cloth_settings: bpy.types.ClothSettings = self.find_cloth_settings()
-        cloth_settings.mass = 1.000
-        cloth_settings.air_damping = 1.000
-        cloth_settings.tension_stiffness = 5
-        cloth_settings.compression_stiffness = 5
-        cloth_settings.shear_stiffness = 5
-        cloth_settings.bending_stiffness = 0.05
-        cloth_settings.tension_damping = 0
-        cloth_settings.compression_damping = 0
-        cloth_settings.shear_damping = 0
-        cloth_settings.bending_damping = 0.5
-
 
 TUNERS = TunerRegistry(
     (0, NothingClothTuner),
@@ -204,6 +331,9 @@ TUNERS = TunerRegistry(
     (3, BreastPyramidClothTuner),
 )
 
+# static enum items are copied once at registration, unlike an items callback that runs on every redraw
+_PRESET_ITEMS = tuple(TUNERS.to_enum_property_items())
+
 
 class MMDAppendClothAdjuster(bpy.types.Panel):
     bl_idname = "MMD_APPEND_PT_cloth_adjuster"
@@ -214,7 +344,8 @@ class MMDAppendClothAdjuster(bpy.types.Panel):
 
     @classmethod
     def poll(cls, context: bpy.types.Context):
-        return MeshEditor(context.active_object).find_cloth_modifier() is not None
+        active_object = context.active_object
+        return active_object is not None and _find_cloth_modifier(active_object) is not None
 
     def draw(self, context: bpy.types.Context):
         layout = self.layout
@@ -248,7 +379,7 @@ class MMDAppendClothAdjuster(bpy.types.Panel):
         row.prop(cloth_settings, "frame_start", text="Simulation Start")
         row.prop(cloth_settings, "frame_end", text="Simulation End")
 
-        if MeshEditor(mesh_object).find_subsurface_modifier("physics_cloth_subsurface") is None:
+        if _find_cloth_subsurface_modifier(mesh_object) is None:
             return
 
         col = layout.column(align=True)
@@ -265,28 +396,41 @@ class CopyClothAdjusterSettings(bpy.types.Operator):
     def poll(cls, context: bpy.types.Context):
         return len([o for o in context.selected_objects if o.type == "MESH"]) >= 2
 
+    # presets comes first, its update callback overwrites the other settings
+    COPIED_PROPERTY_NAMES = (
+        "presets",
+        "mass",
+        "stiffness",
+        "damping",
+        "collision_quality",
+        "distance_min",
+        "impulse_clamp",
+    )
+
     def execute(self, context: bpy.types.Context):
         from_object = context.active_object
         from_settings = from_object.mmd_tools_append_cloth_settings
         from_modifier = MeshEditor(from_object).get_cloth_modifier()
 
-        for to_object in context.selected_objects:
-            if to_object.type != "MESH":
-                continue
+        # read the source values once instead of once per target
+        from_values = tuple((name, getattr(from_settings, name)) for name in self.COPIED_PROPERTY_NAMES)
 
-            if from_object == to_object:
-                continue
+        with _BatchedClothUpdates():
+            for to_object in context.selected_objects:
+                if to_object.type != "MESH":
+                    continue
 
-            MeshEditor(to_object).get_cloth_modifier(from_modifier.name)
+                if from_object == to_object:
+                    continue
+
+                MeshEditor(to_object).get_cloth_modifier(from_modifier.name)
+
+                to_settings = to_object.mmd_tools_append_cloth_settings
+                for name, value in from_values:
+                    setattr(to_settings, name, value)
 
-            to_settings = to_object.mmd_tools_append_cloth_settings
-            to_settings.presets = from_settings.presets
-            to_settings.mass = from_settings.mass
-            to_settings.stiffness = from_settings.stiffness
-            to_settings.damping = from_settings.damping
-            to_settings.collision_quality = from_settings.collision_quality
-            to_settings.distance_min = from_settings.distance_min
-            to_settings.impulse_clamp = from_settings.impulse_clamp
+        # cloth modifiers may have been added to the selected meshes
+        invalidate_data_caches()
 
         return {"FINISHED"}
 
@@ -312,12 +456,12 @@ class SelectClothMesh(bpy.types.Operator):
         if active_object.type != "MESH":
             return False
 
-        return MeshEditor(active_object).find_cloth_modifier() is not None
+        return _find_cloth_modifier(active_object) is not None
 
     @staticmethod
     def filter_only_in_mmd_model(
         key_object: bpy.types.Object,
-    ) -> Iterable[bpy.types.Object]:
+    ) -> Iterator[bpy.types.Object]:
         mmd_tools = import_mmd_tools()
         mmd_root = mmd_tools.core.model.FnModel.find_root_object(key_object)
         if mmd_root is None:
@@ -325,30 +469,34 @@ class SelectClothMesh(bpy.types.Operator):
 
         mmd_model = mmd_tools.core.model.Model(mmd_root)
 
-        for obj in mmd_model.meshes():
-            yield obj
+        # cloths() only yields cloth meshes, but model meshes may carry a cloth modifier too
+        yielded_uids: Set[int] = set()
+        for obj in itertools.chain(filter(_is_cloth_mesh, mmd_model.meshes()), mmd_model.cloths()):
+            if obj.session_uid in yielded_uids:
+                continue
 
-        yield from mmd_model.cloths()
+            yielded_uids.add(obj.session_uid)
+            yield obj
 
     def execute(self, context: bpy.types.Context):
         key_object = context.active_object
         key_settings = key_object.mmd_tools_append_cloth_settings
 
-        obj: bpy.types.Object
-        for obj in self.filter_only_in_mmd_model(key_object) if self.only_in_mmd_model else bpy.data.objects:
-            if obj.type != "MESH":
-                continue
-
-            if MeshEditor(obj).find_cloth_modifier() is None:
-                continue
+        checks: List[Callable[[ClothAdjusterSettingsPropertyGroup], bool]] = []
+        if self.only_physics_equals:
+            key_physics = key_settings.physics_key()
+            checks.append(lambda s: s.physics_key() == key_physics)
 
-            if self.only_physics_equals and not key_settings.physics_equals(obj.mmd_tools_append_cloth_settings):
-                continue
+        if self.only_cache_equals:
+            key_cache = key_settings.cache_key()
+            checks.append(lambda s: s.cache_key() == key_cache)
 
-            if self.only_cache_equals and not key_settings.cache_equals(obj.mmd_tools_append_cloth_settings):
-                continue
-
-            obj.select_set(True)
+        obj: bpy.types.Object
+        # both sources only yield cloth meshes
+        for obj in self.filter_only_in_mmd_model(key_object) if self.only_in_mmd_model else _iterate_cloth_mesh_objects():
+            settings = obj.mmd_tools_append_cloth_settings
+            if all(check(settings) for check in checks):
+                obj.select_set(True)
 
         return {"FINISHED"}
 
@@ -370,7 +518,7 @@ class RemoveMeshCloth(bpy.types.Operator):
         if active_object.type != "MESH":
             return False
 
-        return MeshEditor(active_object).find_cloth_modifier() is not None
+        return _find_cloth_modifier(active_object) is not None
 
     def invoke(self, context, event):
         return context.window_manager.invoke_confirm(self, event)
@@ -405,23 +553,49 @@ class ConvertRigidBodyToClothOperator(bpy.types.Operator):
     )
     extend_ribbon_area: bpy.props.BoolProperty(name="Extend Ribbon Area", default=True)
 
+    # (data cache epoch, selected object uids) -> poll result of the last evaluated selection
+    _poll_cache: Tuple[Tuple, bool] = ((), False)
+
     @classmethod
     def poll(cls, context: bpy.types.Context):
         if context.mode != "OBJECT":
             return False
 
+        selected_objects = context.selected_objects
+        key = (get_data_cache_epoch(), tuple(o.session_uid for o in selected_objects))
+        cached_key, cached_result = cls._poll_cache
+        if cached_key == key:
+            return cached_result
+
+        result = cls._poll_selected_objects(selected_objects)
+        cls._poll_cache = (key, result)
+        return result
+
+    @staticmethod
+    def _poll_selected_objects(selected_objects: List[bpy.types.Object]) -> bool:
         selected_mesh_mmd_root = None
         selected_rigid_body_mmd_root = None
 
         mmd_find_root = import_mmd_tools().core.model.FnModel.find_root_object
-        for obj in context.selected_objects:
+
+        # rigid bodies and meshes are never roots themselves, so siblings share the root of their parent
+        parent2mmd_root = {}
+
+        def find_mmd_root(obj):
+            parent = obj.parent
+            if parent not in parent2mmd_root:
+                parent2mmd_root[parent] = mmd_find_root(obj)
+            return parent2mmd_root[parent]
+
+        for obj in selected_objects:
             if obj.type != "MESH":
                 return False
 
-            if obj.mmd_type == "RIGID_BODY":
-                selected_rigid_body_mmd_root = mmd_find_root(obj)
-            elif obj.mmd_type == "NONE":
-                selected_mesh_mmd_root = mmd_find_root(obj)
+            mmd_type = obj.mmd_type
+            if mmd_type == "RIGID_BODY":
+                selected_rigid_body_mmd_root = find_mmd_root(obj)
+            elif mmd_type == "NONE":
+                selected_mesh_mmd_root = find_mmd_root(obj)
 
             if selected_rigid_body_mmd_root == selected_mesh_mmd_root:
                 return selected_rigid_body_mmd_root is not None
@@ -475,15 +649,137 @@ class ConvertRigidBodyToClothOperator(bpy.types.Operator):
         return {"FINISHED"}
 
 
-class ClothAdjusterSettingsPropertyGroup(bpy.types.PropertyGroup):
-    @staticmethod
-    def _update_presets(prop, _):
+def _get_mass(prop) -> float:
+    return getattr(_resolve_cloth(prop.id_data)[0], "mass", 0)
+
+
+def _set_mass(prop, value: float):
+    _assign_cloth_setting(_resolve_cloth(prop.id_data)[0], "mass", value)
+
+
+def _get_stiffness(prop) -> float:
+    return getattr(_resolve_cloth(prop.id_data)[0], "tension_stiffness", 0)
+
+
+def _set_stiffness(prop, value: float):
+    cloth_settings: bpy.types.ClothSettings = _resolve_cloth(prop.id_data)[0]
+    _assign_cloth_setting(cloth_settings, "tension_stiffness", value)
+    _assign_cloth_setting(cloth_settings, "compression_stiffness", value)
+    _assign_cloth_setting(cloth_settings, "shear_stiffness", value)
+
+
+def _get_damping(prop) -> float:
+    return getattr(_resolve_cloth(prop.id_data)[0], "tension_damping", 0)
+
+
+def _set_damping(prop, value: float):
+    cloth_settings: bpy.types.ClothSettings = _resolve_cloth(prop.id_data)[0]
+    _assign_cloth_setting(cloth_settings, "tension_damping", value)
+    _assign_cloth_setting(cloth_settings, "compression_damping", value)
+    _assign_cloth_setting(cloth_settings, "shear_damping", value)
+
+
+def _get_collision_quality(prop) -> int:
+    return getattr(_resolve_cloth(prop.id_data)[1], "collision_quality", 0)
+
+
+def _set_collision_quality(prop, value: int):
+    _assign_cloth_setting(_resolve_cloth(prop.id_data)[1], "collision_quality", value)
+
+
+def _get_distance_min(prop) -> float:
+    return getattr(_resolve_cloth(prop.id_data)[1], "distance_min", 0)
+
+
+def _set_distance_min(prop, value: float):
+    _assign_cloth_setting(_resolve_cloth(prop.id_data)[1], "distance_min", value)
+
+
+def _get_impulse_clamp(prop) -> float:
+    return getattr(_resolve_cloth(prop.id_data)[1], "impulse_clamp", 0)
+
+
+def _set_impulse_clamp(prop, value: float):
+    _assign_cloth_setting(_resolve_cloth(prop.id_data)[1], "impulse_clamp", value)
+
+
+def _get_frame_start(prop) -> int:
+    return getattr(_resolve_cloth(prop.id_data)[2], "frame_start", 0)
+
+
+def _set_frame_start(prop, value: int):
+    _resolve_cloth(prop.id_data)[2].frame_start = value
+
+
+def _get_frame_end(prop) -> int:
+    return getattr(_resolve_cloth(prop.id_data)[2], "frame_end", 0)
+
+
+def _set_frame_end(prop, value: int):
+    _resolve_cloth(prop.id_data)[2].frame_end = value
+
+
+def _get_subdivision_levels(prop) -> int:
+    return getattr(_find_cloth_subsurface_modifier(prop.id_data), "levels", 0)
+
+
+def _update_presets(prop, _):
+    with _BatchedClothUpdates():
         TUNERS[prop.presets](prop.id_data).execute()
 
+
+def _set_subdivision_levels(prop, subdivision_level: int):
+    cloth_mesh_object: bpy.types.Object = prop.id_data
+    cloth_mesh_editor = MeshEditor(cloth_mesh_object)
+
+    cloth_subsurface_modifier = _find_cloth_subsurface_modifier(cloth_mesh_object)
+    if cloth_subsurface_modifier is None:
+        return
+
+    def set_bind_modifier(modifier: bpy.types.Modifier, bind: bool):
+        if modifier is None:
+            return
+
+        if bind and not modifier.show_viewport:
+            return
+
+        if modifier.type == "SURFACE_DEFORM":
+            if bind == modifier.is_bound:
+                return
+            bpy.ops.object.surfacedeform_bind({"object": modifier.id_data}, modifier=modifier.name)
+        elif modifier.type == "CORRECTIVE_SMOOTH":
+            if bind == modifier.is_bind:
+                return
+            bpy.ops.object.correctivesmooth_bind({"object": modifier.id_data}, modifier=modifier.name)
+
+    def set_bind_modifiers(modifiers: Iterable[bpy.types.Modifier], bind: bool):
+        for modifier in modifiers:
+            set_bind_modifier(modifier, bind)
+
+    cloth_corrective_smooth_modifier = cloth_mesh_editor.find_corrective_smooth_modifier()
+    target_mesh_modifiers = _find_surface_deform_modifiers(cloth_mesh_object)
+
+    if cloth_corrective_smooth_modifier is not None:
+        if subdivision_level == 0:
+            cloth_corrective_smooth_modifier.show_viewport = False
+        else:
+            cloth_corrective_smooth_modifier.show_viewport = True
+            set_bind_modifier(cloth_corrective_smooth_modifier, False)
+
+    set_bind_modifiers(target_mesh_modifiers, False)
+
+    cloth_subsurface_modifier.levels = subdivision_level
+    cloth_subsurface_modifier.render_levels = subdivision_level
+
+    set_bind_modifier(cloth_corrective_smooth_modifier, True)
+    set_bind_modifiers(target_mesh_modifiers, True)
+
+
+class ClothAdjusterSettingsPropertyGroup(bpy.types.PropertyGroup):
     presets: bpy.props.EnumProperty(
         name="Presets",
-        items=TUNERS.to_enum_property_items(),
-        update=_update_presets.__func__,
+        items=_PRESET_ITEMS,
+        update=_update_presets,
         default=None,
     )
 
@@ -493,17 +789,10 @@ class ClothAdjusterSettingsPropertyGroup(bpy.types.PropertyGroup):
         soft_max=10,
         step=10,
         unit="MASS",
-        get=lambda p: getattr(MeshEditor(p.id_data).find_cloth_settings(), "mass", 0),
-        set=lambda p, v: setattr(MeshEditor(p.id_data).find_cloth_settings(), "mass", v),
+        get=_get_mass,
+        set=_set_mass,
     )
 
-    @staticmethod
-    def _set_stiffness(prop, value):
-        cloth_settings: bpy.types.ClothSettings = MeshEditor(prop.id_data).find_cloth_settings()
-        cloth_settings.tension_stiffness = value
-        cloth_settings.compression_stiffness = value
-        cloth_settings.shear_stiffness = value
-
     stiffness: bpy.props.FloatProperty(
         name="Stiffness",
         min=0,
@@ -511,41 +800,26 @@ class ClothAdjusterSettingsPropertyGroup(bpy.types.PropertyGroup):
         max=10000,
         precision=3,
         step=10,
-        get=lambda p: getattr(MeshEditor(p.id_data).find_cloth_settings(), "tension_stiffness", 0),
-        set=_set_stiffness.__func__,
+        get=_get_stiffness,
+        set=_set_stiffness,
     )
 
-    @staticmethod
-    def _set_damping(prop, value):
-        cloth_settings: bpy.types.ClothSettings = MeshEditor(prop.id_data).find_cloth_settings()
-        cloth_settings.tension_damping = value
-        cloth_settings.compression_damping = value
-        cloth_settings.shear_damping = value
-
     damping: bpy.props.FloatProperty(
         name="Damping",
         min=0,
         max=50,
         precision=3,
         step=10,
-        get=lambda p: getattr(MeshEditor(p.id_data).find_cloth_settings(), "tension_damping", 0),
-        set=_set_damping.__func__,
+        get=_get_damping,
+        set=_set_damping,
     )
 
     collision_quality: bpy.props.IntProperty(
         name="Collision Quality",
         min=1,
         max=20,
-        get=lambda p: getattr(
-            MeshEditor(p.id_data).find_cloth_collision_settings(),
-            "collision_quality",
-            0,
-        ),
-        set=lambda p, v: setattr(
-            MeshEditor(p.id_data).find_cloth_collision_settings(),
-            "collision_quality",
-            v,
-        ),
+        get=_get_collision_quality,
+        set=_set_collision_quality,
     )
 
     distance_min: bpy.props.FloatProperty(
@@ -554,8 +828,8 @@ class ClothAdjusterSettingsPropertyGroup(bpy.types.PropertyGroup):
         max=1.000,
         step=10,
         unit="LENGTH",
-        get=lambda p: getattr(MeshEditor(p.id_data).find_cloth_collision_settings(), "distance_min", 0),
-        set=lambda p, v: setattr(MeshEditor(p.id_data).find_cloth_collision_settings(), "distance_min", v),
+        get=_get_distance_min,
+        set=_set_distance_min,
     )
 
     impulse_clamp: bpy.props.FloatProperty(
@@ -564,108 +838,50 @@ class ClothAdjusterSettingsPropertyGroup(bpy.types.PropertyGroup):
         max=100,
         precision=3,
         step=10,
-        get=lambda p: getattr(MeshEditor(p.id_data).find_cloth_collision_settings(), "impulse_clamp", 0),
-        set=lambda p, v: setattr(MeshEditor(p.id_data).find_cloth_collision_settings(), "impulse_clamp", v),
+        get=_get_impulse_clamp,
+        set=_set_impulse_clamp,
     )
 
     frame_start: bpy.props.IntProperty(
         name="Simulation Start",
         min=0,
         max=1048574,
-        get=lambda p: getattr(
-            getattr(MeshEditor(p.id_data).find_cloth_modifier(), "point_cache", None),
-            "frame_start",
-            0,
-        ),
-        set=lambda p, v: setattr(MeshEditor(p.id_data).find_cloth_modifier().point_cache, "frame_start", v),
+        get=_get_frame_start,
+        set=_set_frame_start,
     )
 
     frame_end: bpy.props.IntProperty(
         name="Simulation End",
         min=1,
         max=1048574,
-        get=lambda p: getattr(
-            getattr(MeshEditor(p.id_data).find_cloth_modifier(), "point_cache", None),
-            "frame_end",
-            0,
-        ),
-        set=lambda p, v: setattr(MeshEditor(p.id_data).find_cloth_modifier().point_cache, "frame_end", v),
+        get=_get_frame_end,
+        set=_set_frame_end,
     )
 
-    @staticmethod
-    def _set_subdivision_levels(prop, subdivision_level):
-        cloth_mesh_object: bpy.types.Object = prop.id_data
-        cloth_mesh_editor = MeshEditor(cloth_mesh_object)
-
-        cloth_subsurface_modifier = cloth_mesh_editor.find_subsurface_modifier(name="physics_cloth_subsurface")
-        if cloth_subsurface_modifier is None:
-            return
-
-        def set_bind_modifier(modifier: bpy.types.Modifier, bind: bool):
-            if modifier is None:
-                return
-
-            if bind and not modifier.show_viewport:
-                return
-
-            if modifier.type == "SURFACE_DEFORM":
-                if bind == modifier.is_bound:
-                    return
-                bpy.ops.object.surfacedeform_bind({"object": modifier.id_data}, modifier=modifier.name)
-            elif modifier.type == "CORRECTIVE_SMOOTH":
-                if bind == modifier.is_bind:
-                    return
-                bpy.ops.object.correctivesmooth_bind({"object": modifier.id_data}, modifier=modifier.name)
-
-        def set_bind_modifiers(modifiers: Iterable[bpy.types.Modifier], bind: bool):
-            for modifier in modifiers:
-                set_bind_modifier(modifier, bind)
-
-        cloth_corrective_smooth_modifier = cloth_mesh_editor.find_corrective_smooth_modifier()
-        target_mesh_modifiers: List[bpy.types.SurfaceDeformModifier] = [m for o in bpy.data.objects for m in o.modifiers if m.type == "SURFACE_DEFORM" and m.target == cloth_mesh_object]
-
-        if cloth_corrective_smooth_modifier is not None:
-            if subdivision_level == 0:
-                cloth_corrective_smooth_modifier.show_viewport = False
-            else:
-                cloth_corrective_smooth_modifier.show_viewport = True
-                set_bind_modifier(cloth_corrective_smooth_modifier, False)
-
-        set_bind_modifiers(target_mesh_modifiers, False)
-
-        cloth_subsurface_modifier.levels = subdivision_level
-        cloth_subsurface_modifier.render_levels = subdivision_level
-
-        set_bind_modifier(cloth_corrective_smooth_modifier, True)
-        set_bind_modifiers(target_mesh_modifiers, True)
-
     subdivision_levels: bpy.props.IntProperty(
         name="Subdivision Levels",
         min=0,
         soft_max=2,
         max=6,
-        get=lambda p: getattr(
-            MeshEditor(p.id_data).find_subsurface_modifier(name="physics_cloth_subsurface"),
-            "levels",
-            0,
-        ),
-        set=_set_subdivision_levels.__func__,
+        get=_get_subdivision_levels,
+        set=_set_subdivision_levels,
     )
 
-    def physics_equals(self, obj):
+    def physics_key(self) -> Tuple:
+        cloth_settings, collision_settings, _point_cache = _resolve_cloth(self.id_data)
         return (
-            isinstance(obj, ClothAdjusterSettingsPropertyGroup)
-            and self.presets == obj.presets
-            and self.mass == obj.mass
-            and self.stiffness == obj.stiffness
-            and self.damping == obj.damping
-            and self.collision_quality == obj.collision_quality
-            and self.distance_min == obj.distance_min
-            and self.impulse_clamp == obj.impulse_clamp
+            self.presets,
+            getattr(cloth_settings, "mass", 0),
+            getattr(cloth_settings, "tension_stiffness", 0),
+            getattr(cloth_settings, "tension_damping", 0),
+            getattr(collision_settings, "collision_quality", 0),
+            getattr(collision_settings, "distance_min", 0),
+            getattr(collision_settings, "impulse_clamp", 0),
         )
 
-    def cache_equals(self, obj):
-        return isinstance(obj, ClothAdjusterSettingsPropertyGroup) and self.frame_start == obj.frame_start and self.frame_end == obj.frame_end
+    def cache_key(self) -> Tuple:
+        point_cache = _resolve_cloth(self.id_data)[2]
+        return (getattr(point_cache, "frame_start", 0), getattr(point_cache, "frame_end", 0))
 
     @staticmethod
     def register():
@@ -24,6 +24,8 @@ PATH_BLENDS_MMD_APPEND_GEOMETRIES = os.path.join(PACKAGE_PATH, "blends", "MMDApp
 class GeometryEditor(NodeEditor):
     # pylint: disable=too-many-public-methods
 
+    __slots__ = ()
+
     _library_blend_file_path = PATH_BLENDS_MMD_APPEND_GEOMETRIES
     _node_group_type = GeometryNodeGroup
 
@@ -14,6 +14,8 @@ PATH_BLENDS_MMD_APPEND_MATERIALS = os.path.join(PACKAGE_PATH, "blends", "MMDAppe
 
 
 class NodeEditor(ABC):
+    __slots__ = ("node_tree", "nodes", "links")
+
     def __init__(self, node_tree: bpy.types.NodeTree) -> None:
         super().__init__()
         self.node_tree = node_tree
@@ -46,22 +48,27 @@ class NodeEditor(ABC):
         pass
 
     def list_nodes(self, node_type: type = None, label: str = None, name: str = None, node_frame: bpy.types.NodeFrame = None) -> Iterable[bpy.types.Node]:
+        # node names are unique within a node tree, so a name filter is a single lookup
+        nodes = self.nodes if name is None else filter(None, (self.nodes.get(name),))
+
         node: bpy.types.Node
-        for node in self.nodes:
+        for node in nodes:
             if node_type is not None and not isinstance(node, node_type):
                 continue
 
             if label is not None and node.label != label:
                 continue
 
-            if name is not None and node.name != name:
-                continue
-
             if node_frame is not None and node.parent != node_frame:
                 continue
 
             yield node
 
+    def list_node_groups(self, node_frame: bpy.types.NodeFrame) -> Iterable[bpy.types.NodeGroup]:
+        # comparing bl_idname strings is cheaper than isinstance against an RNA type
+        node_group_idname = self._node_group_type.__name__
+        return (n for n in self.nodes if n.bl_idname == node_group_idname and n.parent == node_frame)
+
     @staticmethod
     def check_setting_node(node: bpy.types.Node) -> bool:
         return node.label
@@ -145,6 +152,8 @@ class NodeEditor(ABC):
 class MaterialEditor(NodeEditor):
     # pylint: disable=too-many-public-methods
 
+    __slots__ = ("material",)
+
     @staticmethod
     def srgb_to_linearrgb(color: float) -> float:
         if color < 0:
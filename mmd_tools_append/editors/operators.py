@@ -497,12 +497,13 @@ class AutoSegmentationOperator(bpy.types.Operator):
             target_bmesh: bmesh.types.BMesh = bmesh.new()
             mesh: bpy.types.Mesh = mesh_object.data
             target_bmesh.from_mesh(mesh, face_normals=False, vertex_normals=False)
-            color_layer = segmentation.get_color_layer(target_bmesh, self.segmentation_vertex_color_attribute_name)
+            segmentation.get_color_layer(target_bmesh, self.segmentation_vertex_color_attribute_name)
 
             auto_segment_start_secs = time.perf_counter()
 
             segment_result = segmentation.auto_segment(
                 target_bmesh,
+                mesh,
                 self.cost_threshold,
                 self.maximum_area_threshold,
                 self.minimum_area_threshold,
@@ -541,14 +542,15 @@ class AutoSegmentationOperator(bpy.types.Operator):
             cost_sorted_segment_contacts = segment_result.remain_segment_contacts
             max_cost_normalized = cost_sorted_segment_contacts[-1].cost_normalized if len(cost_sorted_segment_contacts) > 0 else 0
 
+            target_bmesh.to_mesh(mesh)
+
             segmentation.assign_vertex_colors(
                 segments,
-                color_layer,
+                mesh,
+                self.segmentation_vertex_color_attribute_name,
                 self.segmentation_vertex_color_random_seed,
             )
 
-            target_bmesh.to_mesh(mesh)
-
             segmentation.setup_materials(mesh, self.segmentation_vertex_color_attribute_name)
             segmentation.setup_aovs(context.view_layer.aovs, self.segmentation_vertex_color_attribute_name)
 
@@ -2,9 +2,8 @@
 # This file is part of MMD Tools Append.
 
 
-import bisect
-import collections
 import dataclasses
+import heapq
 import itertools
 import math
 import random
@@ -12,7 +11,9 @@ from typing import Dict, List, Optional, Set, Tuple
 
 import bmesh
 import bpy
-import mathutils
+import numpy as np
+
+from ..utilities import MessageException
 
 
 def _to_blender_color(uint8_color: int) -> float:
@@ -54,30 +55,23 @@ SEGMANTATION_COLORS: List[RGBA] = [
     ]
 ]
 # fmt: on
+SEGMANTATION_COLORS_NP = np.array(SEGMANTATION_COLORS, dtype=np.float32)
 
 
-SQRT_PI = math.sqrt(math.pi)
-
-
-def _area_to_circumference(area: float) -> float:
-    return math.sqrt(area) / SQRT_PI
+INV_SQRT_PI = 1.0 / math.sqrt(math.pi)
 
 
 TriLoopIndex = int
-LoopPairId = int
-VertexPairId = int
 VertexIndex = int
-VertexGroupPairId = int
 SegmentContactId = int
 SegmentPairId = int
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Segment:
     index: int
     area: float = 0.0
     perimeter: float = 0.0
-    non_contact_perimeter: float = 0.0
     tri_loop0s: Set[bmesh.types.BMLoop] = dataclasses.field(default_factory=set)
     segment_contact_ids: Set[SegmentContactId] = dataclasses.field(default_factory=set)
 
@@ -88,7 +82,7 @@ class Segment:
         return self.index == other.index
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class SegmentContact:
     index: SegmentContactId
     cost: float
@@ -117,32 +111,34 @@ class SegmentContact:
     def __eq__(self, other):
         return self.index == other.index
 
-    def calc_perimeter_cost(self):
-        segment0 = self.segment0
-        segment0_perimeter = segment0.perimeter
-        segment0_area = segment0.area
 
-        segment1 = self.segment1
-        segment1_perimeter = segment1.perimeter
-        segment1_area = segment1.area
+def _calc_perimeter_cost(segment0_perimeter: float, segment0_area: float, segment1_perimeter: float, segment1_area: float, length: float) -> float:
+    # circumference of the circle with the same area
+    segment0_circumference = math.sqrt(segment0_area) * INV_SQRT_PI
+    segment1_circumference = math.sqrt(segment1_area) * INV_SQRT_PI
+    merged_area = segment0_area + segment1_area
 
-        mean_ratio = (segment0_area + segment1_area) / (segment0_area / (segment0_perimeter / _area_to_circumference(segment0_area)) + segment1_area / (segment1_perimeter / _area_to_circumference(segment1_area)))
-        # Code with the same meaning as below.
-        # mean_ratio = statistics.harmonic_mean(
-        #     (
-        #         segment0_perimeter/_area_to_circumference(segment0_area),
-        #         segment1_perimeter/_area_to_circumference(segment1_area),
-        #     ),
-        #     (
-        #         segment0_area,
-        #         segment1_area,
-        #     )
-        # )
+    mean_ratio = merged_area / (segment0_area * segment0_circumference / segment0_perimeter + segment1_area * segment1_circumference / segment1_perimeter)
+    # Code with the same meaning as below.
+    # mean_ratio = statistics.harmonic_mean(
+    #     (
+    #         segment0_perimeter/segment0_circumference,
+    #         segment1_perimeter/segment1_circumference,
+    #     ),
+    #     (
+    #         segment0_area,
+    #         segment1_area,
+    #     )
+    # )
 
-        merged_ratio = (segment0_perimeter + segment1_perimeter - 2 * self.length) / _area_to_circumference(segment0_area + segment1_area)
-        result = max(merged_ratio / mean_ratio - 1, 0)
+    merged_ratio = (segment0_perimeter + segment1_perimeter - 2 * length) / (math.sqrt(merged_area) * INV_SQRT_PI)
+    return max(merged_ratio / mean_ratio - 1, 0)
 
-        return result
+
+def _calc_segment_contact_perimeter_cost(segment_contact: SegmentContact) -> float:
+    segment0 = segment_contact.segment0
+    segment1 = segment_contact.segment1
+    return _calc_perimeter_cost(segment0.perimeter, segment0.area, segment1.perimeter, segment1.area, segment_contact.length)
 
 
 @dataclasses.dataclass
@@ -153,43 +149,25 @@ class SegmentResult:
     tri_loops: List[bmesh.types.BMLoop]
 
 
-def _to_loop_pair_id(loop0: bmesh.types.BMLoop, loop1: bmesh.types.BMLoop, loop_pair_shift: int) -> LoopPairId:
-    loop0_index = loop0.index
-    loop1_index = loop1.index
-    if loop0_index > loop1_index:
-        return loop1_index + (loop0_index << loop_pair_shift)
-    return loop0_index + (loop1_index << loop_pair_shift)
+# pair ids pack the higher index above the lower one; indices of a mesh always fit in 32 bits
+PAIR_ID_SHIFT = 32
 
 
-def _to_vertex_pair_id(vert0: bmesh.types.BMVert, vert1: bmesh.types.BMVert, vertex_pair_shift: int) -> VertexPairId:
-    vert0_index = vert0.index
-    vert1_index = vert1.index
-    if vert0_index > vert1_index:
-        return vert1_index + (vert0_index << vertex_pair_shift)
-    return vert0_index + (vert1_index << vertex_pair_shift)
+def _to_pair_id(index0: int, index1: int) -> int:
+    low, high = (index0, index1) if index0 < index1 else (index1, index0)
+    return (high << PAIR_ID_SHIFT) | low
 
 
-def _to_segment_pair_id(segment0: Segment, segment1: Segment, segment_pair_shift: int) -> SegmentPairId:
-    segment0_index = segment0.index
-    segment1_index = segment1.index
-    if segment0_index > segment1_index:
-        return segment1_index + (segment0_index << segment_pair_shift)
-    return segment0_index + (segment1_index << segment_pair_shift)
+def _to_tri_loop_index(loop: bmesh.types.BMLoop) -> TriLoopIndex:
+    return min(loop.index, loop.link_loop_next.index, loop.link_loop_prev.index)
 
 
-def _to_tri_loop_index(loop: bmesh.types.BMLoop) -> TriLoopIndex:
-    li0 = loop.index
-    li1 = loop.link_loop_next.index
-    li2 = loop.link_loop_prev.index
+# memo miss marker, distinct from any cached value
+_MISS = object()
 
-    # return min(i0, i1, i2)
-    if li0 > li1:
-        if li1 > li2:
-            return li2
-        return li1
-    if li0 > li2:
-        return li2
-    return li0
+
+def _get_segment_pair_id(segment_contact: SegmentContact) -> SegmentPairId:
+    return _to_pair_id(segment_contact.segment0.index, segment_contact.segment1.index)
 
 
 def _get_cost_normalized(segment_contact: SegmentContact) -> float:
@@ -215,6 +193,7 @@ def _setup_output_aov(node_tree: bpy.types.NodeTree, segmentation_output_aov_nam
 
 def auto_segment(
     target_bmesh: bmesh.types.BMesh,
+    mesh: bpy.types.Mesh,
     cost_threshold: float,
     maximum_area_threshold: float,
     minimum_area_threshold: float,
@@ -240,28 +219,26 @@ def auto_segment(
         edge_seam_cost_factor,
         _calc_vi2vgi2weights(target_bmesh, ignore_vertex_group_indices),
         target_bmesh,
+        mesh,
         tri_loops,
     )
 
     if segment_count == 0:
         return SegmentResult(set(), [], 0.0, [])
 
-    segment_pair_shift = int(math.log2(segment_count) / 2 + 1)
+    # min-heap of (cost_normalized, segment_contact_id) with lazy deletion;
+    # entries of removed or re-costed segment contacts become stale and are skipped when popped
+    cost_heap: List[Tuple[float, SegmentContactId]] = [(sc.cost_normalized, sc.index) for sc in sci2segment_contacts.values()]
+    heapq.heapify(cost_heap)
 
-    cost_sorted_segment_contacts = sorted(sci2segment_contacts.values(), key=_get_cost_normalized)
+    # segment contacts over the area thresholds; segment areas only grow, so they never become mergable again
+    rejected_segment_contact_ids: Set[SegmentContactId] = set()
 
     def _remove_segment_contact(sci: SegmentContactId):
         sc = sci2segment_contacts.pop(sci)
         sc.segment0.segment_contact_ids.discard(sci)
         sc.segment1.segment_contact_ids.discard(sci)
-        for i in range(
-            bisect.bisect_left(cost_sorted_segment_contacts, sc.cost_normalized, key=_get_cost_normalized),
-            len(cost_sorted_segment_contacts),
-        ):
-            if sc != cost_sorted_segment_contacts[i]:
-                continue
-            del cost_sorted_segment_contacts[i]
-            return
+        rejected_segment_contact_ids.discard(sci)
 
     result_segments: Set[Segment] = set()
     result_loop_count: int = 0
@@ -269,86 +246,93 @@ def auto_segment(
     last_merged_cost: float = 0
 
     is_not_perimeter_cost_factor_0 = perimeter_cost_factor != 0
+    is_contact_length_factor_positive = contact_length_factor > 0
 
-    merging = True
-    while merging:
-        merging = False
+    # hot loop locals
+    heappop = heapq.heappop
+    heappush = heapq.heappush
+    get_segment_contact = sci2segment_contacts.get
+    get_segment_contact_item = sci2segment_contacts.__getitem__
 
-        for segment_contact in cost_sorted_segment_contacts:
-            sci = segment_contact.index
+    while cost_heap:
+        cost, sci = heappop(cost_heap)
 
-            cost = segment_contact.cost_normalized
-            if cost > cost_threshold:
-                break
+        segment_contact = get_segment_contact(sci)
+        if segment_contact is None or segment_contact.cost_normalized != cost or sci in rejected_segment_contact_ids:
+            # stale entry
+            continue
 
-            dst_segment = segment_contact.segment0
-            src_segment = segment_contact.segment1
+        if cost > cost_threshold:
+            break
 
-            src_segment_area = src_segment.area
-            if src_segment_area > minimum_area_threshold and dst_segment.area + src_segment_area > maximum_area_threshold:
-                continue
+        dst_segment = segment_contact.segment0
+        src_segment = segment_contact.segment1
 
-            merging = True
-            last_merged_cost = cost
+        src_segment_area = src_segment.area
+        if src_segment_area > minimum_area_threshold and dst_segment.area + src_segment_area > maximum_area_threshold:
+            rejected_segment_contact_ids.add(sci)
+            continue
 
-            dst_segment.tri_loop0s.update(src_segment.tri_loop0s)
-            dst_segment.area += src_segment_area
+        last_merged_cost = cost
 
-            _remove_segment_contact(sci)
+        dst_segment_tri_loop0s = dst_segment.tri_loop0s
+        dst_segment_tri_loop0s.update(src_segment.tri_loop0s)
+        dst_segment.area += src_segment_area
 
-            dst_segment_contact_ids = dst_segment.segment_contact_ids
-            src_segment_contact_ids = src_segment.segment_contact_ids
-            for src_sci in src_segment_contact_ids:
-                sc = sci2segment_contacts[src_sci]
-                if sc.segment_replace(src_segment, dst_segment):
-                    if sc.segment0 == sc.segment1:
-                        _remove_segment_contact(src_sci)
-                    else:
-                        dst_segment_contact_ids.add(src_sci)
+        _remove_segment_contact(sci)
 
-            if len(dst_segment_contact_ids) == 0:
-                # dst_segment is isolated
-                result_segments.add(dst_segment)
-                result_loop_count += len(dst_segment.tri_loop0s)
-                continue
+        # total length of the boundary between dst_segment and src_segment
+        shared_length = segment_contact.length
 
-            if is_not_perimeter_cost_factor_0:
-                dst_segment.perimeter = dst_segment.non_contact_perimeter + sum(sci2segment_contacts[sci].length for sci in dst_segment_contact_ids)
+        dst_segment_contact_ids = dst_segment.segment_contact_ids
+        src_segment_contact_ids = src_segment.segment_contact_ids
+        for src_sci in src_segment_contact_ids:
+            sc = get_segment_contact_item(src_sci)
+            if sc.segment_replace(src_segment, dst_segment):
+                if sc.segment0 == sc.segment1:
+                    shared_length += sc.length
+                    _remove_segment_contact(src_sci)
+                else:
+                    dst_segment_contact_ids.add(src_sci)
 
-            # collect mergable segment contacts
-            spi2mergable_segment_contacts: Dict[SegmentPairId, Set[SegmentContact]] = collections.defaultdict(set)
-            for edge_sci in dst_segment_contact_ids:
-                sc = sci2segment_contacts[edge_sci]
-                spi = _to_segment_pair_id(sc.segment0, sc.segment1, segment_pair_shift)
-                spi2mergable_segment_contacts[spi].add(sc)
+        dst_segment.perimeter += src_segment.perimeter - 2 * shared_length
 
-            # merge mergable segment contacts
-            for mergable_segment_contacts in spi2mergable_segment_contacts.values():
-                if len(mergable_segment_contacts) <= 1:
-                    continue
+        if len(dst_segment_contact_ids) == 0:
+            # dst_segment is isolated
+            result_segments.add(dst_segment)
+            result_loop_count += len(dst_segment_tri_loop0s)
+            continue
 
-                mergable_segment_contacts_iter = iter(mergable_segment_contacts)
-                merged_sc = next(mergable_segment_contacts_iter)
-                for sc in mergable_segment_contacts_iter:
-                    merged_sc.cost += sc.cost
-                    merged_sc.length += sc.length
-                    _remove_segment_contact(sc.index)
-
-                for i in range(
-                    bisect.bisect_left(cost_sorted_segment_contacts, merged_sc.cost_normalized, key=_get_cost_normalized),
-                    len(cost_sorted_segment_contacts),
-                ):
-                    if merged_sc != cost_sorted_segment_contacts[i]:
-                        continue
-                    break
-
-                # update the cost and then sort cost_sorted_segment_contacts
-                merged_sc.cost_normalized = (perimeter_cost_factor * merged_sc.calc_perimeter_cost() if is_not_perimeter_cost_factor_0 else 0) + (merged_sc.cost / (merged_sc.length * contact_length_factor if contact_length_factor > 0 else 1))
-                bisect.insort_left(cost_sorted_segment_contacts, cost_sorted_segment_contacts.pop(i), key=_get_cost_normalized)
-
-            # since the cost has been updated, it must enter a new loop to follow the sort results.
-            break
+        # merge mergable segment contacts, the ones between the same segment pair are adjacent once sorted;
+        # the area check only tests segment1, so the survivor is the one whose segment0 is the larger segment,
+        # then the one whose segment0 is dst_segment, then the lowest index
+        for _, mergable_segment_contacts_iter in itertools.groupby(
+            sorted(map(get_segment_contact_item, dst_segment_contact_ids), key=lambda sc: (_get_segment_pair_id(sc), -sc.segment0.area, sc.segment0 != dst_segment, sc.index)),
+            key=_get_segment_pair_id,
+        ):
+            merged_sc = next(mergable_segment_contacts_iter)
+            is_merged = False
+            for sc in mergable_segment_contacts_iter:
+                merged_sc.cost += sc.cost
+                merged_sc.length += sc.length
+                _remove_segment_contact(sc.index)
+                is_merged = True
+
+            if not is_merged:
+                continue
+
+            # update the cost and then push it again, the previous entry becomes stale
+            cost_normalized = (perimeter_cost_factor * _calc_segment_contact_perimeter_cost(merged_sc) if is_not_perimeter_cost_factor_0 else 0) + (merged_sc.cost / (merged_sc.length * contact_length_factor) if is_contact_length_factor_positive else merged_sc.cost)
+            merged_sci = merged_sc.index
+            if cost_normalized == merged_sc.cost_normalized and merged_sci not in rejected_segment_contact_ids:
+                # the queued entry is still valid
+                continue
+
+            merged_sc.cost_normalized = cost_normalized
+            rejected_segment_contact_ids.discard(merged_sci)
+            heappush(cost_heap, (cost_normalized, merged_sci))
 
+    cost_sorted_segment_contacts = sorted(sci2segment_contacts.values(), key=_get_cost_normalized)
     result_segments.update({s for sc in cost_sorted_segment_contacts for s in (sc.segment0, sc.segment1)})
 
     return SegmentResult(result_segments, cost_sorted_segment_contacts, last_merged_cost, tri_loops)
@@ -360,22 +344,44 @@ def get_color_layer(target_bmesh: bmesh.types.BMesh, segmentation_vertex_color_a
 
 def assign_vertex_colors(
     segments: Set[Segment],
-    color_layer: bmesh.types.BMLayerItem,
+    mesh: bpy.types.Mesh,
+    segmentation_vertex_color_attribute_name: str,
     segmentation_vertex_color_random_seed: int,
 ):
-    segmantation_colors = SEGMANTATION_COLORS.copy()
+    """Paints the segments into the color attribute of the mesh the segments' bmesh was written to."""
+    segmantation_colors = SEGMANTATION_COLORS_NP
     segmantation_color_count = len(segmantation_colors)
 
     if segmentation_vertex_color_random_seed != 0:
+        # shuffle the row order the same way the color list used to be shuffled
+        color_order = list(range(segmantation_color_count))
         rng = random.Random(segmentation_vertex_color_random_seed)
-        rng.shuffle(segmantation_colors)
+        rng.shuffle(color_order)
+        segmantation_colors = segmantation_colors[color_order]
 
+    loop_indices: List[int] = []
+    color_indices: List[int] = []
     for index, segment in enumerate(segments):
-        segmentation_color = segmantation_colors[index % segmantation_color_count]
         for tri_loop0 in segment.tri_loop0s:
-            tri_loop0[color_layer] = segmentation_color
-            tri_loop0.link_loop_prev[color_layer] = segmentation_color
-            tri_loop0.link_loop_next[color_layer] = segmentation_color
+            loop_indices.extend((tri_loop0.index, tri_loop0.link_loop_prev.index, tri_loop0.link_loop_next.index))
+        color_indices.extend(itertools.repeat(index % segmantation_color_count, 3 * len(segment.tri_loop0s)))
+
+    # the face corner byte color attribute written from the get_color_layer layer, other attributes may share its name
+    color_attribute = next(
+        (a for a in mesh.color_attributes if a.name == segmentation_vertex_color_attribute_name and a.domain == "CORNER" and a.data_type == "BYTE_COLOR"),
+        None,
+    )
+    if color_attribute is None:
+        raise MessageException(f"Mesh '{mesh.name}' has no face corner byte color attribute named '{segmentation_vertex_color_attribute_name}'")
+
+    # bmesh color layers hold the raw sRGB values, so go through color_srgb to keep the painted values as is
+    color_data = color_attribute.data
+    loop_colors = np.empty(len(color_data) * 4, dtype=np.float32)
+    color_data.foreach_get("color_srgb", loop_colors)
+
+    loop_colors = loop_colors.reshape(-1, 4)
+    loop_colors[np.array(loop_indices, dtype=np.int64)] = segmantation_colors[np.array(color_indices, dtype=np.int64)]
+    color_data.foreach_set("color_srgb", loop_colors.ravel())
 
 
 def paint_selected_face_colors(mesh_object: bpy.types.Object, color: Optional[RGBA], segmentation_vertex_color_attribute_name: str):
@@ -423,53 +429,35 @@ def _calc_segment_contacts(
     edge_seam_cost_factor: float,
     vi2vgi2weights: Dict[int, Dict[int, float]],
     target_bmesh: bmesh.types.BMesh,
+    mesh: bpy.types.Mesh,
     tri_loops: List[bmesh.types.BMLoop],
 ) -> Tuple[Dict[SegmentContactId, SegmentContact], int]:
-    vertex_count = len(target_bmesh.verts)
-    vertex_pair_shift = int(math.log2(vertex_count) / 2 + 1)
+    # target_bmesh is loaded from mesh, so the loop indices of both match
+    loop_face_selects, loop_face_material_indices, loop_edge_sharps, loop_edge_seams = _to_loop_face_edge_flags(mesh)
 
-    vpi2weights: Dict[VertexPairId, float] = {}
+    # skip the costs that are weighted out
+    is_not_vertex_group_weight_cost_factor_0 = vertex_group_weight_cost_factor != 0
+    is_not_vertex_group_change_cost_factor_0 = vertex_group_change_cost_factor != 0
+    is_not_face_angle_cost_factor_0 = face_angle_cost_factor != 0
 
-    def _calc_vertex_group_weight_cost(vert0: bmesh.types.BMVert, vert1: bmesh.types.BMVert) -> float:
-        vpi = _to_vertex_pair_id(vert0, vert1, vertex_pair_shift)
-        if vpi in vpi2weights:
-            return vpi2weights[vpi]
+    if is_not_vertex_group_weight_cost_factor_0 or is_not_vertex_group_change_cost_factor_0:
+        vertex_group_weight_csr = _to_vertex_group_weight_csr(vi2vgi2weights)
 
-        vgi2weights0 = vi2vgi2weights[vert0.index]
-        vgi2weights1 = vi2vgi2weights[vert1.index]
-
-        weight = 0.0
-        for vgi0, weight0 in vgi2weights0.items():
-            weight += abs(weight0 - vgi2weights1.get(vgi0, 0.0))
-
-        for vgi1, weight1 in vgi2weights1.items():
-            weight += abs(weight1 - vgi2weights0.get(vgi1, 0.0))
-
-        return vpi2weights.setdefault(vpi, weight)
+    if is_not_vertex_group_change_cost_factor_0:
+        loop_heaviest_vgis = _calc_loop_heaviest_vertex_group_indices(vertex_group_weight_csr, target_bmesh)
 
     tli2heaviest_vgi: Dict[TriLoopIndex, int] = {}
 
     def _calc_heaviest_vertex_group_index(tli: TriLoopIndex, loop: bmesh.types.BMLoop) -> int:
-        if tli in tli2heaviest_vgi:
-            return tli2heaviest_vgi[tli]
-
-        max_vgi: int = -1
-        max_weight: float = -1.0
-        vgi2weights: Dict[int, float] = {}
-        for vgi, weight in itertools.chain(
-            vi2vgi2weights[loop.vert.index].items(),
-            vi2vgi2weights[loop.link_loop_next.vert.index].items(),
-            vi2vgi2weights[loop.link_loop_prev.vert.index].items(),
-        ):
-            weight += vgi2weights.get(vgi, 0)
-            if weight > max_weight:
-                max_vgi = vgi
-                max_weight = weight
-            vgi2weights[vgi] = weight
-        return tli2heaviest_vgi.setdefault(tli, max_vgi)
+        heaviest_vgi = tli2heaviest_vgi.get(tli, _MISS)
+        if heaviest_vgi is not _MISS:
+            return heaviest_vgi
+
+        heaviest_vgi = tli2heaviest_vgi[tli] = loop_heaviest_vgis[loop.index]
+        return heaviest_vgi
 
-    # loop_pair_id
-    processed_loop_pair_ids: Set[LoopPairId] = set()
+    # loops whose radial pairs are processed, a loop of an ngon belongs to several triangles
+    processed_loops = bytearray(3 * len(tri_loops))
 
     __next_segment_id: int = 0
 
@@ -478,119 +466,276 @@ def _calc_segment_contacts(
         __next_segment_id += 1
         return Segment(__next_segment_id)
 
-    loop_count = 3 * len(tri_loops)
-    loop_pair_shift = int(math.log2(loop_count) / 2 + 1)
-
-    # tri_loop_index to segment map
-    tli2segment: Dict[TriLoopIndex, Segment] = collections.defaultdict(_new_segment)
+    # tri_loop_index to segment map, each face yields 3 * (loops - 2) >= loops triangle loops, so it covers every loop index
+    tli2segment: List[Optional[Segment]] = [None] * (3 * len(tri_loops))
 
     # segment_contact_index to segment_contact map
     sci2segment_contacts: Dict[SegmentContactId, SegmentContact] = {}
 
     half_pi_inverse = 2 / math.pi
 
-    next_segment_contact_id: SegmentContactId = 0
+    # per segment contact (edge length, unit costs in cost_factors order) and (segment0, segment1), combined after the scan
+    contact_terms: List[Tuple[float, float, float, float, float, float, float]] = []
+    contact_segments: List[Tuple[Segment, Segment]] = []
+    # per segment contact (edge vertex0, edge vertex1, this opposite vertex, that opposite vertex) indices
+    contact_vertex_indices: List[Tuple[VertexIndex, VertexIndex, VertexIndex, VertexIndex]] = []
+
+    # triangle areas and perimeters in one vectorized pass, in tri_loops order
+    vertex_coordinates = np.array([v.co for v in target_bmesh.verts], dtype=np.float64).reshape(-1, 3)
+    tri_coordinates = vertex_coordinates[np.array([[loop.vert.index for loop in tri_loop] for tri_loop in tri_loops], dtype=np.int64).reshape(-1, 3)]
+    tri_edges = tri_coordinates - np.roll(tri_coordinates, -1, axis=1)
+    tri_areas: List[float] = (0.5 * np.linalg.norm(np.cross(tri_edges[:, 0], -tri_edges[:, 2]), axis=1)).tolist()
+    tri_perimeters: List[float] = np.linalg.norm(tri_edges, axis=2).sum(axis=1).tolist()
 
     tri_loop: List[bmesh.types.BMLoop]
-    for tri_loop in tri_loops:
+    for tri_index, tri_loop in enumerate(tri_loops):
         tri_loop0 = tri_loop[0]
-        this_face = tri_loop0.face
+        tri_loop0_index = tri_loop0.index
 
-        if not this_face.select:
+        if not loop_face_selects[tri_loop0_index]:
             continue
 
+        this_material_index = loop_face_material_indices[tri_loop0_index]
+
         this_tli = _to_tri_loop_index(tri_loop0)
-        this_heaviest_vertex_group_index = _calc_heaviest_vertex_group_index(this_tli, tri_loop0)
+        this_heaviest_vertex_group_index = _calc_heaviest_vertex_group_index(this_tli, tri_loop0) if is_not_vertex_group_change_cost_factor_0 else -1
 
         this_segment = tli2segment[this_tli]
-        v0: mathutils.Vector = tri_loop0.vert.co
-        v1: mathutils.Vector = tri_loop[1].vert.co
-        v2: mathutils.Vector = tri_loop[2].vert.co
-        this_segment.area = mathutils.geometry.area_tri(v0, v1, v2)  # pylint: disable=assignment-from-no-return
-        this_segment.perimeter = (v0 - v1).length + (v1 - v2).length + (v2 - v0).length
+        if this_segment is None:
+            this_segment = tli2segment[this_tli] = _new_segment()
+        this_segment.area = tri_areas[tri_index]
+        this_segment.perimeter = tri_perimeters[tri_index]
         this_segment.tri_loop0s.add(tri_loop0)
 
-        this_segment_contact_perimeter = 0.0
-
         for this_loop in tri_loop:
+            this_loop_index = this_loop.index
+            if processed_loops[this_loop_index]:
+                continue
+            processed_loops[this_loop_index] = 1
+
             edge_length = -1
             that_loop = this_loop
             while (that_loop := that_loop.link_loop_radial_next) != this_loop:
-                lpi = _to_loop_pair_id(this_loop, that_loop, loop_pair_shift)
-                if lpi in processed_loop_pair_ids:
+                # faces are scanned in loop index order, so the pair was processed from that_loop already
+                that_loop_index = that_loop.index
+                if that_loop_index < this_loop_index:
                     continue
-                processed_loop_pair_ids.add(lpi)
 
-                that_face = that_loop.face
-                if not that_face.select:
+                if not loop_face_selects[that_loop_index]:
                     continue
 
                 if edge_length < 0:
                     this_edge = this_loop.edge
                     edge_length = this_edge.calc_length()
                     this_verts = this_edge.verts
-                    vert0 = this_verts[0]
-                    vert1 = this_verts[1]
-                    this_vert2 = this_loop.link_loop_prev.vert
-
-                    this_loop_vertex_group_weight_cost = _calc_vertex_group_weight_cost(vert0, this_vert2) + _calc_vertex_group_weight_cost(vert1, this_vert2)
-                    this_loop_edge_sharp_cost = 0 if this_edge.smooth else 1
-                    this_loop_edge_seam_cost = 1 if this_edge.seam else 0
+                    vert0_index = this_verts[0].index
+                    vert1_index = this_verts[1].index
+                    this_vert2_index = this_loop.link_loop_prev.vert.index
+                    this_normal = this_loop.calc_normal() if is_not_face_angle_cost_factor_0 else None
 
                     # cost:sharp = 1:1
-                    cost_edge_sharp = edge_length * this_loop_edge_sharp_cost
+                    this_loop_edge_sharp_cost = 1 if loop_edge_sharps[this_loop_index] else 0
 
                     # cost:seam = 1:1
-                    cost_edge_seam = edge_length * this_loop_edge_seam_cost
+                    this_loop_edge_seam_cost = 1 if loop_edge_seams[this_loop_index] else 0
 
                 that_tli = _to_tri_loop_index(that_loop)
-                that_heaviest_vertex_group_index = _calc_heaviest_vertex_group_index(that_tli, that_loop)
-                that_vert2 = that_loop.link_loop_prev.vert
+                that_heaviest_vertex_group_index = _calc_heaviest_vertex_group_index(that_tli, that_loop) if is_not_vertex_group_change_cost_factor_0 else -1
                 that_segment = tli2segment[that_tli]
+                if that_segment is None:
+                    that_segment = tli2segment[that_tli] = _new_segment()
 
-                # cost:vertex weight = 1:1
-                cost_vertex_group_weight = edge_length * 0.25 * (this_loop_vertex_group_weight_cost + _calc_vertex_group_weight_cost(vert0, that_vert2) + _calc_vertex_group_weight_cost(vert1, that_vert2))
-
-                # cost:vertex group change = 1:1
-                cost_vertex_group_change = edge_length * (0 if this_heaviest_vertex_group_index == that_heaviest_vertex_group_index else 1)
-
-                # cost:angle = 1:90 degrees
-                cost_face_angle = edge_length * half_pi_inverse * this_loop.calc_normal().angle(that_loop.calc_normal())
-
-                # cost:material = 1:1
-                cost_material_change = edge_length * (0 if this_face.material_index == that_face.material_index else 1)
-
-                cost_total = sum(
+                contact_terms.append(
                     (
-                        vertex_group_weight_cost_factor * cost_vertex_group_weight,
-                        vertex_group_change_cost_factor * cost_vertex_group_change,
-                        face_angle_cost_factor * cost_face_angle,
-                        material_change_cost_factor * cost_material_change,
-                        edge_sharp_cost_factor * cost_edge_sharp,
-                        edge_seam_cost_factor * cost_edge_seam,
+                        edge_length,
+                        # vertex weight, filled in after the scan
+                        0.0,
+                        # cost:vertex group change = 1:1
+                        0 if this_heaviest_vertex_group_index == that_heaviest_vertex_group_index else 1,
+                        # cost:angle = 1:90 degrees
+                        half_pi_inverse * this_normal.angle(that_loop.calc_normal()) if is_not_face_angle_cost_factor_0 else 0.0,
+                        # cost:material = 1:1
+                        0 if this_material_index == loop_face_material_indices[that_loop_index] else 1,
+                        this_loop_edge_sharp_cost,
+                        this_loop_edge_seam_cost,
                     )
                 )
+                contact_segments.append((this_segment, that_segment))
+                if is_not_vertex_group_weight_cost_factor_0:
+                    contact_vertex_indices.append((vert0_index, vert1_index, this_vert2_index, that_loop.link_loop_prev.vert.index))
+
+    # combine the weighted costs of all segment contacts in one vectorized pass
+    cost_factors = np.array(
+        (
+            vertex_group_weight_cost_factor,
+            vertex_group_change_cost_factor,
+            face_angle_cost_factor,
+            material_change_cost_factor,
+            edge_sharp_cost_factor,
+            edge_seam_cost_factor,
+        ),
+        dtype=np.float64,
+    )
+    contact_term_array = np.array(contact_terms, dtype=np.float64).reshape(-1, 1 + len(cost_factors))
 
-                segment_contact = SegmentContact(
-                    next_segment_contact_id := next_segment_contact_id + 1,
-                    cost_total,
-                    cost_total / (edge_length * contact_length_factor if contact_length_factor > 0 else 1),
-                    edge_length,
-                    this_segment,
-                    that_segment,
-                )
-                this_segment_contact_perimeter += edge_length
-                sci2segment_contacts[segment_contact.index] = segment_contact
-                this_segment.segment_contact_ids.add(segment_contact.index)
-                that_segment.segment_contact_ids.add(segment_contact.index)
+    # cost:vertex weight = 1:1, the mean over both edge vertices against both opposite vertices
+    if is_not_vertex_group_weight_cost_factor_0:
+        contact_vertex_index_pairs = np.array(contact_vertex_indices, dtype=np.int64).reshape(-1, 4)[:, [[0, 2], [1, 2], [0, 3], [1, 3]]].reshape(-1, 2)
+        contact_term_array[:, 1] = 0.25 * _calc_vertex_group_weight_costs(vertex_group_weight_csr, contact_vertex_index_pairs).reshape(-1, 4).sum(axis=1)
+
+    contact_length_array = contact_term_array[:, 0]
+    contact_cost_array = contact_length_array * (contact_term_array[:, 1:] @ cost_factors)
+    contact_cost_normalized_array = contact_cost_array / (contact_length_array * contact_length_factor) if contact_length_factor > 0 else contact_cost_array
 
-        this_segment.non_contact_perimeter = this_segment.perimeter - this_segment_contact_perimeter
+    for segment_contact_id, (cost_total, cost_normalized, edge_length, (this_segment, that_segment)) in enumerate(
+        zip(contact_cost_array.tolist(), contact_cost_normalized_array.tolist(), contact_length_array.tolist(), contact_segments),
+        start=1,
+    ):
+        sci2segment_contacts[segment_contact_id] = SegmentContact(segment_contact_id, cost_total, cost_normalized, edge_length, this_segment, that_segment)
+        this_segment.segment_contact_ids.add(segment_contact_id)
+        that_segment.segment_contact_ids.add(segment_contact_id)
 
     if perimeter_cost_factor != 0:
         for segment_contact in sci2segment_contacts.values():
-            segment_contact.cost_normalized += perimeter_cost_factor * segment_contact.calc_perimeter_cost()
+            segment_contact.cost_normalized += perimeter_cost_factor * _calc_segment_contact_perimeter_cost(segment_contact)
+
+    return sci2segment_contacts, __next_segment_id
+
+
+def _to_loop_face_edge_flags(mesh: bpy.types.Mesh) -> Tuple[List[bool], List[int], List[bool], List[bool]]:
+    """Returns the face select, face material index, edge sharp and edge seam of each loop, indexed by loop index."""
+    polygons = mesh.polygons
+    polygon_loop_totals = np.empty(len(polygons), dtype=np.int32)
+    polygons.foreach_get("loop_total", polygon_loop_totals)
+    polygon_selects = np.empty(len(polygons), dtype=bool)
+    polygons.foreach_get("select", polygon_selects)
+    polygon_material_indices = np.empty(len(polygons), dtype=np.int32)
+    polygons.foreach_get("material_index", polygon_material_indices)
+
+    edges = mesh.edges
+    edge_sharps = np.empty(len(edges), dtype=bool)
+    edges.foreach_get("use_edge_sharp", edge_sharps)
+    edge_seams = np.empty(len(edges), dtype=bool)
+    edges.foreach_get("use_seam", edge_seams)
+
+    loop_edge_indices = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("edge_index", loop_edge_indices)
+
+    return (
+        np.repeat(polygon_selects, polygon_loop_totals).tolist(),
+        np.repeat(polygon_material_indices, polygon_loop_totals).tolist(),
+        edge_sharps[loop_edge_indices].tolist(),
+        edge_seams[loop_edge_indices].tolist(),
+    )
+
+
+def _expand_ranges(starts: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    """Concatenates range(start, start + length) of each start and length."""
+    offsets = np.repeat(np.cumsum(lengths) - lengths, lengths)
+    return np.repeat(starts, lengths) + (np.arange(offsets.size) - offsets)
+
+
+VertexGroupWeightCSR = Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+
+
+def _to_vertex_group_weight_csr(vi2vgi2weights: Dict[int, Dict[int, float]]) -> VertexGroupWeightCSR:
+    """Returns (weight_counts, weight_indptr, weight_vgis, weight_values), the weights of vertex vi are at weight_indptr[vi]:weight_indptr[vi + 1]."""
+    vertex_count = len(vi2vgi2weights)
+
+    weight_counts = np.fromiter((len(vi2vgi2weights[vi]) for vi in range(vertex_count)), dtype=np.int64, count=vertex_count)
+    weight_indptr = np.concatenate(([0], np.cumsum(weight_counts)))
+    weight_vgis = np.fromiter((vgi for vi in range(vertex_count) for vgi in vi2vgi2weights[vi].keys()), dtype=np.int64, count=weight_indptr[-1])
+    weight_values = np.fromiter((weight for vi in range(vertex_count) for weight in vi2vgi2weights[vi].values()), dtype=np.float64, count=weight_indptr[-1])
+    return weight_counts, weight_indptr, weight_vgis, weight_values
+
+
+def _calc_loop_heaviest_vertex_group_indices(vertex_group_weight_csr: VertexGroupWeightCSR, target_bmesh: bmesh.types.BMesh) -> List[int]:
+    """Returns the heaviest vertex group index over the vertices of each loop and its next and previous loops, indexed by loop index.
+
+    Loops of unselected faces and loops without vertex groups get -1.
+    """
+    loop_indices: List[int] = []
+    loop_vertex_indices: List[Tuple[VertexIndex, VertexIndex, VertexIndex]] = []
+    for face in target_bmesh.faces:
+        if not face.select:
+            continue
+
+        face_loops = face.loops
+        face_vertex_indices = [loop.vert.index for loop in face_loops]
+        loop_indices.extend(loop.index for loop in face_loops)
+        loop_vertex_indices.extend(zip(face_vertex_indices, face_vertex_indices[1:] + face_vertex_indices[:1], face_vertex_indices[-1:] + face_vertex_indices[:-1]))
+
+    loop_heaviest_vgis = np.full(max(loop_indices, default=-1) + 1, -1, dtype=np.int64)
+    loop_heaviest_vgis[np.array(loop_indices, dtype=np.int64)] = _calc_heaviest_vertex_group_indices(vertex_group_weight_csr, np.array(loop_vertex_indices, dtype=np.int64).reshape(-1, 3))
+    return loop_heaviest_vgis.tolist()
+
+
+def _calc_heaviest_vertex_group_indices(vertex_group_weight_csr: VertexGroupWeightCSR, vertex_index_triples: np.ndarray) -> np.ndarray:
+    """Returns the vertex group index with the largest weight sum over each vertex index triple, -1 if none.
+
+    Ties go to the vertex group whose running sum reaches the maximum first, accumulating the vertices in triple order.
+    """
+    weight_counts, weight_indptr, weight_vgis, weight_values = vertex_group_weight_csr
+    triple_count = len(vertex_index_triples)
+
+    # the weights of each triple in accumulation order
+    vertex_indices = vertex_index_triples.ravel()
+    lengths = weight_counts[vertex_indices]
+    positions = _expand_ranges(weight_indptr[vertex_indices], lengths)
+    entry_triples = np.repeat(np.arange(vertex_indices.size) // 3, lengths)
+    entry_vgis = weight_vgis[positions]
+    entry_weights = weight_values[positions]
+
+    # running sum per (triple, vertex group), a vertex group occurs at most once per vertex so at most three times per triple
+    entry_keys = (entry_triples << PAIR_ID_SHIFT) | entry_vgis
+    order = np.argsort(entry_keys, kind="stable")
+    sorted_keys = entry_keys[order]
+    sorted_weights = entry_weights[order]
+    is_continued = sorted_keys[1:] == sorted_keys[:-1]
+    sorted_running_sums = sorted_weights.copy()
+    for _ in range(2):
+        sorted_running_sums[1:] = np.where(is_continued, sorted_weights[1:] + sorted_running_sums[:-1], sorted_weights[1:])
+
+    entry_running_sums = np.empty_like(sorted_running_sums)
+    entry_running_sums[order] = sorted_running_sums
+
+    triple_maximums = np.full(triple_count, -np.inf)
+    np.maximum.at(triple_maximums, entry_triples, entry_running_sums)
+
+    # the first entry reaching the maximum wins, as a running strict maximum would pick
+    reaching_entries = np.flatnonzero(entry_running_sums == triple_maximums[entry_triples])
+    reached_triples, first_reaching_positions = np.unique(entry_triples[reaching_entries], return_index=True)
+
+    heaviest_vgis = np.full(triple_count, -1, dtype=np.int64)
+    heaviest_vgis[reached_triples] = entry_vgis[reaching_entries[first_reaching_positions]]
+    return heaviest_vgis
+
+
+def _calc_vertex_group_weight_costs(vertex_group_weight_csr: VertexGroupWeightCSR, vertex_index_pairs: np.ndarray) -> np.ndarray:
+    """Returns the vertex group weight difference of each vertex index pair.
+
+    The difference of a vertex group assigned to both vertices is counted from each side, so twice.
+    """
+    weight_counts, weight_indptr, weight_vgis, weight_values = vertex_group_weight_csr
+
+    pair_ids, pair_inverse = np.unique(
+        np.minimum(vertex_index_pairs[:, 0], vertex_index_pairs[:, 1]) | (np.maximum(vertex_index_pairs[:, 0], vertex_index_pairs[:, 1]) << PAIR_ID_SHIFT),
+        return_inverse=True,
+    )
+
+    # (pair, vertex group) keys with the weights of the lower vertex added and those of the higher vertex subtracted
+    group_keys: List[np.ndarray] = []
+    group_weights: List[np.ndarray] = []
+    for vertex_indices, sign in ((pair_ids & ((1 << PAIR_ID_SHIFT) - 1), 1.0), (pair_ids >> PAIR_ID_SHIFT, -1.0)):
+        lengths = weight_counts[vertex_indices]
+        positions = _expand_ranges(weight_indptr[vertex_indices], lengths)
+        group_keys.append((np.repeat(np.arange(pair_ids.size), lengths) << PAIR_ID_SHIFT) | weight_vgis[positions])
+        group_weights.append(sign * weight_values[positions])
+
+    unique_group_keys, group_inverse, group_counts = np.unique(np.concatenate(group_keys), return_inverse=True, return_counts=True)
+    group_costs = np.abs(np.bincount(group_inverse, weights=np.concatenate(group_weights), minlength=unique_group_keys.size)) * np.where(group_counts > 1, 2, 1)
 
-    return sci2segment_contacts, len(tli2segment)
+    return np.bincount(unique_group_keys >> PAIR_ID_SHIFT, weights=group_costs, minlength=pair_ids.size)[pair_inverse]
 
 
 def _calc_vi2vgi2weights(target_bmesh: bmesh.types.BMesh, ignore_vertex_group_indices: Set[int]) -> Dict[int, Dict[int, float]]:
@@ -3,7 +3,7 @@
 
 import os
 from abc import ABC, abstractmethod
-from typing import Dict, NamedTuple, Tuple
+from typing import Dict, List, NamedTuple, Optional, Tuple
 
 import bpy
 import bpy.utils.previews
@@ -39,6 +39,8 @@ class TunerRegistry:
         self.previews = bpy.utils.previews.new()  # pylint: disable=assignment-from-no-return
 
         self.tuners: Dict[str, TunerDescription] = {}
+        self.tuner_names: Dict[str, str] = {}
+        self._enum_property_items: Optional[List[Tuple[str, str, str, int, int]]] = None
         for tuner_index, tuner in tuners:
             self.add(tuner_index, tuner)
 
@@ -52,6 +54,11 @@ class TunerRegistry:
         icon_path = os.path.join(PACKAGE_PATH, "thumbnails", icon_filename)
         icon_id = self.previews.load(icon_filename, icon_path, "IMAGE").icon_id
         self.tuners[tuner.get_id()] = TunerDescription(tuner_index, tuner, icon_filename, icon_id)
-
-    def to_enum_property_items(self):
-        return [(id, t.tuner.get_name(), "", t.icon_id, t.tuner_index) for id, t in self.tuners.items()]
+        self.tuner_names[tuner.get_id()] = tuner.get_name()
+        self._enum_property_items = None
+
+    def to_enum_property_items(self) -> List[Tuple[str, str, str, int, int]]:
+        """Returns the enum items of the tuners, built once and shared until another tuner is added."""
+        if self._enum_property_items is None:
+            self._enum_property_items = [(id, t.tuner.get_name(), "", t.icon_id, t.tuner_index) for id, t in self.tuners.items()]
+        return self._enum_property_items
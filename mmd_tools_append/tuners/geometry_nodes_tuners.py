@@ -19,12 +19,10 @@ class GeometryNodesUtilities:
 
     @staticmethod
     def find_geometry_node_modifier(obj: bpy.types.Object) -> Optional[bpy.types.NodesModifier]:
-        modifier: bpy.types.Modifier
-        for modifier in obj.modifiers:
-            if not modifier.is_active:
-                continue
-            if modifier.type == "NODES":
-                return modifier
+        # only one modifier of the stack is active at a time
+        modifier: Optional[bpy.types.Modifier] = obj.modifiers.active
+        if modifier is not None and modifier.type == "NODES":
+            return modifier
         return None
 
 
@@ -14,6 +14,8 @@ PATH_BLENDS_MMD_APPEND_LIGHTINGS = os.path.join(PACKAGE_PATH, "blends", "MMDAppe
 
 
 class LightingUtilities:
+    __slots__ = ("collection", "object_appender")
+
     def __init__(self, collection):
         self.collection = collection
         self.object_appender = ObjectAppender("mmd_tools_append_lighting_mark", PATH_BLENDS_MMD_APPEND_LIGHTINGS)
@@ -2,6 +2,7 @@
 # This file is part of MMD Tools Append.
 
 from abc import abstractmethod
+from typing import Set
 
 import bpy
 from bpy.app.translations import pgettext as _
@@ -10,9 +11,14 @@ from ..editors.nodes import MaterialEditor
 
 
 class MaterialAdjusterUtilities(MaterialEditor):
+    __slots__ = ()
+
     def check_attached(self, label: str) -> bool:
         return self.find_node(bpy.types.ShaderNodeGroup, label=label) is not None
 
+    def list_attached(self) -> Set[str]:
+        return {node.label for node in self.list_nodes(bpy.types.ShaderNodeGroup) if node.label in ADJUSTERS}
+
     def check_attachable(self) -> bool:
         return self.find_active_principled_shader_node() is not None
 
@@ -1,6 +1,7 @@
 # Copyright 2021 UuuNyaa <UuuNyaa@gmail.com>
 # This file is part of MMD Tools Append.
 
+from typing import Set
 
 import bpy
 from bpy.app.translations import pgettext as _
@@ -8,16 +9,26 @@ from bpy.app.translations import pgettext_iface as iface_
 
 from ..editors.geometry_nodes import GeometryEditor
 from ..editors.nodes import MaterialEditor
+from ..tuners import geometry_nodes_tuners, lighting_tuners, material_tuners
 from ..tuners.geometry_nodes_tuners import GeometryNodesUtilities
 from ..tuners.lighting_tuners import LightingUtilities
 from ..tuners.material_adjusters import (
+    ADJUSTERS,
     EmissionAdjuster,
     GlitterAdjuster,
     MaterialAdjusterUtilities,
     WetAdjuster,
 )
 from ..tuners.operators import AttachMaterialAdjuster, CopyTuneMaterialSettings, DetachMaterialAdjuster, FreezeLighting
-from ..utilities import is_mmd_tools_installed
+from ..utilities import get_data_cache_epoch, is_mmd_tools_installed
+
+_translation_properties = (
+    _("Light Strength"),
+    _("Image Strength"),
+)
+
+# SkyPanel draws on every redraw, so the light probe scan is reused until the data cache epoch moves
+_IRRADIANCE_CACHE = {"epoch": -1, "value": False}
 
 
 class SkyPanel(bpy.types.Panel):
@@ -31,11 +42,6 @@ class SkyPanel(bpy.types.Panel):
     def poll(cls, context):
         return context.scene.world is not None
 
-    _translation_properties = [
-        _("Light Strength"),
-        _("Image Strength"),
-    ]
-
     def draw(self, context: bpy.types.Context):
         world: bpy.types.World = context.scene.world
 
@@ -52,8 +58,6 @@ class SkyPanel(bpy.types.Panel):
         if not scene_has_irradiance_volumes:
             layout.label(text="IrradianceVolume not found. Please add it.", icon="ERROR")
 
-        utilities.draw_setting_shader_node_properties(layout, utilities.list_nodes(node_frame=node_frame))
-
         col = layout.column(align=True)
         col.label(text="for Eevee lighting, check Render Properties.")
 
@@ -64,16 +68,41 @@ class SkyPanel(bpy.types.Panel):
 
     @staticmethod
     def _scene_has_irradiance_volumes():
-        obj: bpy.types.Object
-        for obj in bpy.data.objects:
-            if obj.type != "LIGHT_PROBE":
-                continue
+        epoch = get_data_cache_epoch()
+        if _IRRADIANCE_CACHE["epoch"] == epoch:
+            return _IRRADIANCE_CACHE["value"]
+
+        # light probe data is far fewer than objects; users skips orphan data left without an object
+        value = any(light_probe.type == "GRID" and light_probe.users > 0 for light_probe in bpy.data.lightprobes)
+
+        _IRRADIANCE_CACHE["value"] = value
+        _IRRADIANCE_CACHE["epoch"] = epoch
+        return value
+
+
+# the node settings live in sub-panels, so Blender skips enumerating the nodes while they are collapsed
+class SkySettingsPanel(bpy.types.Panel):
+    bl_idname = "MMD_APPEND_PT_sky_settings_panel"
+    bl_label = "Settings"
+    bl_space_type = "PROPERTIES"
+    bl_region_type = "WINDOW"
+    bl_context = "world"
+    bl_parent_id = SkyPanel.bl_idname
+
+    @classmethod
+    def poll(cls, context):
+        return SkyPanel.poll(context) and MaterialEditor(context.scene.world).find_node_frame() is not None
+
+    def draw(self, context: bpy.types.Context):
+        utilities = MaterialEditor(context.scene.world)
+        node_frame = utilities.find_node_frame()
+        if node_frame is None:
+            return
+
+        utilities.draw_setting_shader_node_properties(self.layout, utilities.list_nodes(node_frame=node_frame))
 
-            light_probe = obj.data
-            if light_probe.type == "GRID":
-                return True
 
-        return False
+_FREEZE_ID = FreezeLighting.bl_idname
 
 
 class LightingPanel(bpy.types.Panel):
@@ -100,19 +129,20 @@ class LightingPanel(bpy.types.Panel):
         # Lighting Name
         row = col.row(align=True)
         row.alignment = "CENTER"
-        row.label(text=row.enum_item_name(mmd_tools_append_lighting, "thumbnails", mmd_tools_append_lighting.thumbnails))
+        row.label(text=lighting_tuners.TUNERS.tuner_names.get(mmd_tools_append_lighting.thumbnails, ""))
 
         utilities = LightingUtilities(context.collection)
         lighting = utilities.find_active_lighting()
         if lighting is None:
             return
 
-        layout.prop(lighting, "location")
-        layout.prop(lighting, "rotation_euler")
-        layout.prop(lighting, "scale")
+        col = layout.column(align=True)
+        col.prop(lighting, "location")
+        col.prop(lighting, "rotation_euler")
+        col.prop(lighting, "scale")
 
         row = layout.row(align=False)
-        row.operator(FreezeLighting.bl_idname)
+        row.operator(_FREEZE_ID)
 
 
 class MaterialPanel(bpy.types.Panel):
@@ -125,11 +155,11 @@ class MaterialPanel(bpy.types.Panel):
     @classmethod
     def poll(cls, context):
         obj = context.active_object
-        return is_mmd_tools_installed() and obj.active_material and obj.mmd_type == "NONE"
+        return obj is not None and obj.active_material is not None and is_mmd_tools_installed() and obj.mmd_type == "NONE"
 
     def draw(self, context):
         material = context.active_object.active_material
-        mmd_tools_append_material = bpy.context.material.mmd_tools_append_material
+        mmd_tools_append_material = material.mmd_tools_append_material
 
         layout = self.layout
         col = layout.column(align=True)
@@ -141,7 +171,7 @@ class MaterialPanel(bpy.types.Panel):
         # Material Name
         row = col.row(align=True)
         row.alignment = "CENTER"
-        row.label(text=row.enum_item_name(mmd_tools_append_material, "thumbnails", mmd_tools_append_material.thumbnails))
+        row.label(text=material_tuners.TUNERS.tuner_names.get(mmd_tools_append_material.thumbnails, ""))
 
         col = layout.column(align=True)
         col.label(text="Batch Operation:")
@@ -155,12 +185,40 @@ class MaterialPanel(bpy.types.Panel):
         op.to_active = False
         op.to_selection = True
 
-        utilities = MaterialEditor(material)
+
+class MaterialSettingsPanel(bpy.types.Panel):
+    bl_idname = "MMD_APPEND_PT_material_settings_panel"
+    bl_label = "Settings"
+    bl_space_type = "PROPERTIES"
+    bl_region_type = "WINDOW"
+    bl_context = "material"
+    bl_parent_id = MaterialPanel.bl_idname
+
+    @classmethod
+    def poll(cls, context):
+        return MaterialPanel.poll(context) and MaterialEditor(context.active_object.active_material).find_node_frame() is not None
+
+    def draw(self, context):
+        utilities = MaterialEditor(context.active_object.active_material)
         node_frame = utilities.find_node_frame()
         if node_frame is None:
             return
 
-        utilities.draw_setting_shader_node_properties(layout, utilities.list_nodes(node_type=bpy.types.ShaderNodeGroup, node_frame=node_frame))
+        utilities.draw_setting_shader_node_properties(self.layout, utilities.list_node_groups(node_frame))
+
+
+_ADJUSTER_NAMES = {class_: name for name, class_ in ADJUSTERS.items()}
+
+_ATTACH_ID = AttachMaterialAdjuster.bl_idname
+_DETACH_ID = DetachMaterialAdjuster.bl_idname
+
+
+def _draw_adjuster_operator(layout, attached_names: Set[str], class_, text, icon):
+    adjuster_name = _ADJUSTER_NAMES[class_]
+    if adjuster_name in attached_names:
+        layout.operator(_DETACH_ID, text=text, icon="X").adjuster_name = adjuster_name
+    else:
+        layout.operator(_ATTACH_ID, text=text, icon=icon).adjuster_name = adjuster_name
 
 
 class MaterialAdjusterPanel(bpy.types.Panel):
@@ -172,7 +230,8 @@ class MaterialAdjusterPanel(bpy.types.Panel):
 
     @classmethod
     def poll(cls, context):
-        return context.object.active_material
+        obj = context.object
+        return obj is not None and obj.active_material is not None
 
     def draw(self, context):
         active_object = context.active_object
@@ -198,21 +257,31 @@ class MaterialAdjusterPanel(bpy.types.Panel):
 
         grid = col.grid_flow(row_major=True, columns=2)
 
-        def draw_operator(layout, class_, text, icon):
-            if utilities.check_attached(class_.get_name()):
-                layout.operator(DetachMaterialAdjuster.bl_idname, text=text, icon="X").adjuster_name = class_.get_name()
-            else:
-                layout.operator(AttachMaterialAdjuster.bl_idname, text=text, icon=icon).adjuster_name = class_.get_name()
+        attached_names = utilities.list_attached()
+        _draw_adjuster_operator(grid, attached_names, WetAdjuster, text="Wet", icon="MOD_FLUIDSIM")
+        _draw_adjuster_operator(grid, attached_names, GlitterAdjuster, text="Glitter", icon="PMARKER_ACT")
+        _draw_adjuster_operator(grid, attached_names, EmissionAdjuster, text="Emission", icon="LIGHT")
 
-        draw_operator(grid, WetAdjuster, text="Wet", icon="MOD_FLUIDSIM")
-        draw_operator(grid, GlitterAdjuster, text="Glitter", icon="PMARKER_ACT")
-        draw_operator(grid, EmissionAdjuster, text="Emission", icon="LIGHT")
 
+class MaterialAdjusterSettingsPanel(bpy.types.Panel):
+    bl_idname = "MMD_APPEND_PT_material_adjuster_settings_panel"
+    bl_label = "Settings"
+    bl_space_type = "PROPERTIES"
+    bl_region_type = "WINDOW"
+    bl_context = "material"
+    bl_parent_id = MaterialAdjusterPanel.bl_idname
+
+    @classmethod
+    def poll(cls, context):
+        return MaterialAdjusterPanel.poll(context) and MaterialAdjusterUtilities(context.object.active_material).find_adjusters_node_frame() is not None
+
+    def draw(self, context):
+        utilities = MaterialAdjusterUtilities(context.active_object.active_material)
         node_frame = utilities.find_adjusters_node_frame()
         if node_frame is None:
             return
 
-        utilities.draw_setting_shader_node_properties(layout, utilities.list_nodes(node_type=bpy.types.ShaderNodeGroup, node_frame=node_frame))
+        utilities.draw_setting_shader_node_properties(self.layout, utilities.list_node_groups(node_frame))
 
 
 class GeometryNodesPanel(bpy.types.Panel):
@@ -247,11 +316,30 @@ class GeometryNodesPanel(bpy.types.Panel):
         # Modifier Name
         row = col.row(align=True)
         row.alignment = "CENTER"
-        row.label(text=row.enum_item_name(mmd_tools_append_geometry_nodes, "thumbnails", mmd_tools_append_geometry_nodes.thumbnails))
+        row.label(text=geometry_nodes_tuners.TUNERS.tuner_names.get(mmd_tools_append_geometry_nodes.thumbnails, ""))
+
+
+class GeometryNodesSettingsPanel(bpy.types.Panel):
+    bl_idname = "MMD_APPEND_PT_geometry_nodes_settings_panel"
+    bl_label = "Settings"
+    bl_space_type = "PROPERTIES"
+    bl_region_type = "WINDOW"
+    bl_context = "modifier"
+    bl_parent_id = GeometryNodesPanel.bl_idname
 
-        utilities = GeometryEditor(geometry_node_tree)
+    @classmethod
+    def poll(cls, context: bpy.types.Context):
+        if not GeometryNodesPanel.poll(context):
+            return False
+
+        node_group = GeometryNodesUtilities.find_geometry_node_modifier(context.active_object).node_group
+        return node_group is not None and GeometryEditor(node_group).find_node_frame() is not None
+
+    def draw(self, context: bpy.types.Context):
+        modifier = GeometryNodesUtilities.find_geometry_node_modifier(context.active_object)
+        utilities = GeometryEditor(modifier.node_group)
         node_frame = utilities.find_node_frame()
         if node_frame is None:
             return
 
-        utilities.draw_setting_shader_node_properties(layout, utilities.list_nodes(node_type=bpy.types.GeometryNodeGroup, node_frame=node_frame))
+        utilities.draw_setting_shader_node_properties(self.layout, utilities.list_node_groups(node_frame))
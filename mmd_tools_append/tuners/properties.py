@@ -5,18 +5,26 @@ import bpy
 from bpy.types import GeometryNodeTree
 
 from ..editors.nodes import MaterialEditor
-from ..tuners import geometry_nodes_tuners, lighting_tuners, material_tuners
+from ..tuners import TunerRegistry, geometry_nodes_tuners, lighting_tuners, material_tuners
 
+# the tuners are fixed at import, so the enum items are built once and kept referenced for the lifetime of the addon
+_LIGHTING_ITEMS = lighting_tuners.TUNERS.to_enum_property_items()
+_MATERIAL_ITEMS = material_tuners.TUNERS.to_enum_property_items()
+_GEOMETRY_NODES_ITEMS = geometry_nodes_tuners.TUNERS.to_enum_property_items()
 
-class LightingPropertyGroup(bpy.types.PropertyGroup):
-    @staticmethod
-    def update_lighting_thumbnails(prop: "LightingPropertyGroup", _):
-        bpy.ops.mmd_tools_append.tune_lighting(lighting=prop.thumbnails)  # pylint: disable=no-member
 
+def _to_update_thumbnails(tuners: TunerRegistry):
+    def update_thumbnails(prop: bpy.types.PropertyGroup, _):
+        tuners[prop.thumbnails](prop.id_data).execute()
+
+    return update_thumbnails
+
+
+class LightingPropertyGroup(bpy.types.PropertyGroup):
     thumbnails: bpy.props.EnumProperty(
-        items=lighting_tuners.TUNERS.to_enum_property_items(),
+        items=_LIGHTING_ITEMS,
         description="Choose the lighting you want to use",
-        update=update_lighting_thumbnails.__func__,
+        update=_to_update_thumbnails(lighting_tuners.TUNERS),
     )
 
     @staticmethod
@@ -26,20 +34,22 @@ class LightingPropertyGroup(bpy.types.PropertyGroup):
 
     @staticmethod
     def unregister():
-        del bpy.types.Collection.mmd_tools_append_lighting
+        # already gone when a previous register did not complete
+        if hasattr(bpy.types.Collection, "mmd_tools_append_lighting"):
+            del bpy.types.Collection.mmd_tools_append_lighting
 
 
-class MaterialPropertyGroup(bpy.types.PropertyGroup):
-    @staticmethod
-    def update_material_thumbnails(prop: "MaterialPropertyGroup", _):
-        if prop.update:
-            bpy.ops.mmd_tools_append.tune_material(material=prop.thumbnails)  # pylint: disable=no-member
+def _update_material_thumbnails(prop: "MaterialPropertyGroup", _):
+    if prop.update:
+        material_tuners.TUNERS[prop.thumbnails](prop.id_data).execute()
+
 
+class MaterialPropertyGroup(bpy.types.PropertyGroup):
     update: bpy.props.BoolProperty(description="Whether or not to update active material", default=True)
     thumbnails: bpy.props.EnumProperty(
-        items=material_tuners.TUNERS.to_enum_property_items(),
+        items=_MATERIAL_ITEMS,
         description="Choose the material you want to use",
-        update=update_material_thumbnails.__func__,
+        update=_update_material_thumbnails,
     )
 
     @staticmethod
@@ -49,7 +59,17 @@ class MaterialPropertyGroup(bpy.types.PropertyGroup):
 
     @staticmethod
     def unregister():
-        del bpy.types.Material.mmd_tools_append_material
+        # already gone when a previous register did not complete
+        if hasattr(bpy.types.Material, "mmd_tools_append_material"):
+            del bpy.types.Material.mmd_tools_append_material
+
+
+def _adjust_toon(prop: "GlobalToonSpherePropertyGroup", _):
+    prop._update_all_materials("set_mmd_toon_fac", prop.toon_fac)
+
+
+def _adjust_sphere(prop: "GlobalToonSpherePropertyGroup", _):
+    prop._update_all_materials("set_mmd_sphere_fac", prop.sphere_fac)
 
 
 class GlobalToonSpherePropertyGroup(bpy.types.PropertyGroup):
@@ -62,15 +82,6 @@ class GlobalToonSpherePropertyGroup(bpy.types.PropertyGroup):
                 method = getattr(mat_editor, attr_name, None)
                 if method:
                     method(value)
-
-    @staticmethod
-    def adjust_toon(prop: "GlobalToonSpherePropertyGroup", _):
-        prop._update_all_materials("set_mmd_toon_fac", prop.toon_fac)
-
-    @staticmethod
-    def adjust_sphere(prop: "GlobalToonSpherePropertyGroup", _):
-        prop._update_all_materials("set_mmd_sphere_fac", prop.sphere_fac)
-
     toon_fac: bpy.props.FloatProperty(
         name="Toon Factor",
         description="Adjust the model's MMD toon texture factors globally",
@@ -78,7 +89,7 @@ class GlobalToonSpherePropertyGroup(bpy.types.PropertyGroup):
         min=0.0,
         max=1.0,
         default=1,
-        update=adjust_toon.__func__,
+        update=_adjust_toon,
     )
     sphere_fac: bpy.props.FloatProperty(
         name="Sphere Factor",
@@ -87,7 +98,7 @@ class GlobalToonSpherePropertyGroup(bpy.types.PropertyGroup):
         min=0.0,
         max=1.0,
         default=1,
-        update=adjust_sphere.__func__,
+        update=_adjust_sphere,
     )
 
     @staticmethod
@@ -97,18 +108,16 @@ class GlobalToonSpherePropertyGroup(bpy.types.PropertyGroup):
 
     @staticmethod
     def unregister():
-        del bpy.types.Object.mmd_tools_append_global_toon_sphere
+        # already gone when a previous register did not complete
+        if hasattr(bpy.types.Object, "mmd_tools_append_global_toon_sphere"):
+            del bpy.types.Object.mmd_tools_append_global_toon_sphere
 
 
 class GeometryNodesPropertyGroup(bpy.types.PropertyGroup):
-    @staticmethod
-    def update_geometry_nodes_thumbnails(prop: "GeometryNodesPropertyGroup", _):
-        bpy.ops.mmd_tools_append.tune_geometry_nodes(geometry_nodes=prop.thumbnails)  # pylint: disable=no-member
-
     thumbnails: bpy.props.EnumProperty(
-        items=geometry_nodes_tuners.TUNERS.to_enum_property_items(),
+        items=_GEOMETRY_NODES_ITEMS,
         description="Choose the geometry nodes you want to use",
-        update=update_geometry_nodes_thumbnails.__func__,
+        update=_to_update_thumbnails(geometry_nodes_tuners.TUNERS),
     )
 
     @staticmethod
@@ -118,4 +127,6 @@ class GeometryNodesPropertyGroup(bpy.types.PropertyGroup):
 
     @staticmethod
     def unregister():
-        del GeometryNodeTree.mmd_tools_append_geometry_nodes
+        # already gone when a previous register did not complete
+        if hasattr(GeometryNodeTree, "mmd_tools_append_geometry_nodes"):
+            del GeometryNodeTree.mmd_tools_append_geometry_nodes
@@ -11,6 +11,8 @@ import sys
 import bpy
 from bpy.app.translations import pgettext as _
 
+from . import REGISTER_HOOKS, UNREGISTER_HOOKS
+
 
 def to_int32(value: int) -> int:
     return ((value & 0xFFFFFFFF) ^ 0x80000000) - 0x80000000
@@ -106,6 +108,49 @@ def import_mmd_tools():
     return _MMD_TOOLS_CACHE
 
 
+# bumped on object or light probe updates; caches derived from bpy.data store it and rebuild once it moves
+_DATA_CACHE_EPOCH = [0]
+
+_DATA_CACHE_EPOCH_ID_TYPES = ("OBJECT", "LIGHT_PROBE")
+
+
+def get_data_cache_epoch() -> int:
+    return _DATA_CACHE_EPOCH[0]
+
+
+@bpy.app.handlers.persistent
+def invalidate_data_caches(_scene=None, depsgraph=None):
+    if depsgraph is not None and not any(depsgraph.id_type_updated(id_type) for id_type in _DATA_CACHE_EPOCH_ID_TYPES):
+        return
+
+    _DATA_CACHE_EPOCH[0] += 1
+
+
+_INVALIDATE_DATA_CACHES_HANDLERS = (
+    bpy.app.handlers.depsgraph_update_post,
+    bpy.app.handlers.load_post,
+    bpy.app.handlers.undo_post,
+    bpy.app.handlers.redo_post,
+)
+
+
+def _register_data_cache_handlers():
+    for handlers in _INVALIDATE_DATA_CACHES_HANDLERS:
+        if invalidate_data_caches not in handlers:
+            handlers.append(invalidate_data_caches)
+
+
+def _unregister_data_cache_handlers():
+    for handlers in _INVALIDATE_DATA_CACHES_HANDLERS:
+        if invalidate_data_caches in handlers:
+            handlers.remove(invalidate_data_caches)
+    invalidate_data_caches()
+
+
+REGISTER_HOOKS.append(_register_data_cache_handlers)
+UNREGISTER_HOOKS.append(_unregister_data_cache_handlers)
+
+
 def label_multiline(layout, text="", width=0):
     if text.strip() == "":
         return
@@ -0,0 +1,109 @@
+# Copyright 2026 MMD Tools Append authors
+# This file is part of MMD Tools Append.
+
+from typing import Dict, List, Tuple
+
+import pytest
+
+pytest.importorskip("bpy")
+
+from mmd_tools_append.editors import segmentation  # noqa: E402
+
+
+class _TriangulatedBMesh:
+    def calc_loop_triangles(self):
+        return []
+
+
+def _auto_segment(
+    monkeypatch: pytest.MonkeyPatch,
+    segment_areas: Dict[int, float],
+    contacts: List[Tuple[int, int, float, float]],
+    cost_threshold: float,
+    maximum_area_threshold: float,
+    minimum_area_threshold: float,
+) -> segmentation.SegmentResult:
+    """Runs auto_segment on a fixed contact graph, each segment owns the tri loop of its own index."""
+    segments = {index: segmentation.Segment(index, area=area, perimeter=4.0 * area, tri_loop0s={index}) for index, area in segment_areas.items()}
+
+    sci2segment_contacts = {}
+    for sci, (segment0_index, segment1_index, cost, length) in enumerate(contacts, start=1):
+        segment0 = segments[segment0_index]
+        segment1 = segments[segment1_index]
+        sci2segment_contacts[sci] = segmentation.SegmentContact(sci, cost, cost / length, length, segment0, segment1)
+        segment0.segment_contact_ids.add(sci)
+        segment1.segment_contact_ids.add(sci)
+
+    monkeypatch.setattr(segmentation, "_calc_segment_contacts", lambda *_: (sci2segment_contacts, len(segments)))
+    monkeypatch.setattr(segmentation, "_calc_vi2vgi2weights", lambda *_: {})
+
+    return segmentation.auto_segment(
+        _TriangulatedBMesh(),
+        None,
+        cost_threshold,
+        maximum_area_threshold,
+        minimum_area_threshold,
+        contact_length_factor=1.0,
+        face_angle_cost_factor=0.0,
+        perimeter_cost_factor=0.0,
+        vertex_group_weight_cost_factor=0.0,
+        vertex_group_change_cost_factor=0.0,
+        material_change_cost_factor=0.0,
+        edge_sharp_cost_factor=0.0,
+        edge_seam_cost_factor=0.0,
+        ignore_vertex_group_indices=set(),
+    )
+
+
+def _to_partition(result: segmentation.SegmentResult) -> List[List[int]]:
+    return sorted(sorted(s.tri_loop0s) for s in result.segments)
+
+
+def test_auto_segment_grid():
+    # 1 2 3
+    # 4 5 6
+    # with two parallel contacts of opposite orientation between 2 and 5
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        result = _auto_segment(
+            monkeypatch,
+            {1: 1.0, 2: 1.0, 3: 1.0, 4: 1.0, 5: 1.0, 6: 1.0},
+            [
+                (1, 2, 0.10, 1.0),
+                (2, 3, 0.50, 1.0),
+                (4, 5, 0.20, 1.0),
+                (5, 6, 0.90, 1.0),
+                (1, 4, 0.30, 1.0),
+                (2, 5, 0.40, 1.0),
+                (5, 2, 0.45, 1.0),
+                (3, 6, 0.25, 1.0),
+            ],
+            cost_threshold=0.8,
+            maximum_area_threshold=3.0,
+            minimum_area_threshold=0.5,
+        )
+
+    assert _to_partition(result) == [[1, 2], [3, 6], [4, 5]]
+    assert result.last_merged_cost == pytest.approx(0.25)
+    assert [sc.index for sc in result.remain_segment_contacts] == [5, 2, 4]
+    assert [sc.cost_normalized for sc in result.remain_segment_contacts] == pytest.approx([1.15 / 3.0, 0.50, 0.90])
+
+
+def test_auto_segment_coalesced_contact_keeps_larger_segment0():
+    # once 2 merges into 1, the contacts 3->1 and 2->3 coalesce; only the 3->1 orientation passes the area check
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        result = _auto_segment(
+            monkeypatch,
+            {1: 0.3, 2: 0.3, 3: 5.0},
+            [
+                (1, 2, 0.1, 1.0),
+                (3, 1, 0.4, 1.0),
+                (2, 3, 0.3, 1.0),
+            ],
+            cost_threshold=1.0,
+            maximum_area_threshold=5.5,
+            minimum_area_threshold=1.0,
+        )
+
+    assert _to_partition(result) == [[1, 2, 3]]
+    assert result.last_merged_cost == pytest.approx(0.35)
+    assert not result.remain_segment_contacts